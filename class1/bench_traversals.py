@@ -0,0 +1,228 @@
+"""
+Benchmark suite for the class1 graph traversals.
+
+Generates seeded synthetic graphs (Erdos-Renyi, grid, power-law, long path)
+at several sizes, times each traversal and measures its peak Python memory,
+and writes the results as JSON so two runs can be compared.
+
+Usage:
+    python bench_traversals.py --sizes 1000 10000 --output run.json
+    python bench_traversals.py --output new.json --compare run.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from bfs_levels import bfs_levels
+from csr_graph import CSRGraph
+from dfs_iterative import dfs_order
+
+# bfs.py and dfs.py run their examples on import, keep that out of the output
+with contextlib.redirect_stdout(io.StringIO()):
+    from bfs import bfs_graph
+    from dfs import dfs
+
+
+# --- seeded graph generators, all undirected and returning a CSRGraph ---
+
+def erdos_renyi(n, seed, average_degree=8):
+    """G(n, m) random graph with n * average_degree / 2 edges."""
+    rng = random.Random(seed)
+    m = n * average_degree // 2
+    return CSRGraph.from_edges(n, [(rng.randrange(n), rng.randrange(n)) for _ in range(m)])
+
+
+def grid(n, seed=None):
+    """Square 4-neighbour grid with about n nodes."""
+    side = max(1, int(n ** 0.5))
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            node = r * side + c
+            if c + 1 < side:
+                edges.append((node, node + 1))
+            if r + 1 < side:
+                edges.append((node, node + side))
+    return CSRGraph.from_edges(side * side, edges)
+
+
+def power_law(n, seed, edges_per_node=3):
+    """Barabasi-Albert preferential attachment graph (heavy-tailed degrees)."""
+    rng = random.Random(seed)
+    edges = []
+    # Every edge endpoint is listed once, so picking uniformly from this list
+    # picks nodes proportionally to their degree
+    endpoints = list(range(edges_per_node))
+    for node in range(edges_per_node, n):
+        targets = {rng.choice(endpoints) for _ in range(edges_per_node)}
+        for target in targets:
+            edges.append((node, target))
+            endpoints.extend((node, target))
+    return CSRGraph.from_edges(n, edges)
+
+
+def long_path(n, seed=None):
+    """Path 0 - 1 - ... - n-1, the worst case for recursive DFS."""
+    return CSRGraph.from_edges(n, [(i, i + 1) for i in range(n - 1)])
+
+
+GENERATORS = {
+    "erdos_renyi": erdos_renyi,
+    "grid": grid,
+    "power_law": power_law,
+    "long_path": long_path,
+}
+
+
+# --- traversals under test: name -> (function(graph, start), max nodes) ---
+
+# Their debug prints go to os.devnull rather than a StringIO: a buffer would be
+# allocated inside measure()'s tracemalloc window and dominate the peak.
+
+def _run_bfs_graph(graph, start):
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        return bfs_graph(start, graph)
+
+
+def _run_dfs(graph, start):
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        return dfs(graph, start, [])
+
+
+TRAVERSALS = {
+    # The original scripts print on every step and dfs() keeps visited in a
+    # list, so they are only run on small graphs
+    "bfs_graph": (_run_bfs_graph, 2000),
+    "dfs": (_run_dfs, 2000),
+    "iter_dfs": (dfs_order, None),
+    "bfs_levels": (bfs_levels, None),
+}
+
+
+def measure(function, graph, start, repeat):
+    """
+    Time function(graph, start) and measure its peak traced memory.
+
+    Returns:
+        dict: best wall time over repeat runs and peak bytes allocated
+              during a separate traced run (tracing slows things down, so it
+              is not mixed with the timing runs).
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function(graph, start)
+        best = min(best, time.perf_counter() - start_time)
+    tracemalloc.start()
+    try:
+        function(graph, start)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def run_suite(sizes, generators, traversals, seed=0, repeat=3):
+    """
+    Run every traversal on every generated graph.
+
+    Returns:
+        dict: {"meta": {...}, "results": [one dict per graph/size/traversal]}
+    """
+    results = []
+    for generator_name in generators:
+        for size in sizes:
+            graph = GENERATORS[generator_name](size, seed)
+            for traversal_name in traversals:
+                function, max_nodes = TRAVERSALS[traversal_name]
+                result = {"graph": generator_name, "size": size, "n": graph.n,
+                          "m": graph.m, "traversal": traversal_name}
+                if max_nodes is not None and graph.n > max_nodes:
+                    result["skipped"] = f"more than {max_nodes} nodes"
+                else:
+                    try:
+                        result.update(measure(function, graph, 0, repeat))
+                    except RecursionError:
+                        result["error"] = "RecursionError"
+                results.append(result)
+                print(_format_result(result), file=sys.stderr)
+    meta = {"python": platform.python_version(), "platform": platform.platform(),
+            "seed": seed, "repeat": repeat, "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    return {"meta": meta, "results": results}
+
+
+def _format_result(result):
+    name = f"{result['graph']:<12} n={result['n']:<8} {result['traversal']:<10}"
+    if "seconds" not in result:
+        return f"{name} {result.get('error') or 'skipped: ' + result['skipped']}"
+    return f"{name} {result['seconds'] * 1000:10.2f} ms {result['peak_bytes'] / 1024:10.1f} KiB"
+
+
+def compare(baseline, current, threshold=0.2):
+    """
+    Compare two suite outputs and report runs that got slower or bigger.
+
+    Args:
+        baseline (dict): Earlier run_suite() output.
+        current (dict): New run_suite() output.
+        threshold (float): Relative increase that counts as a regression.
+
+    Returns:
+        list: Human readable regression messages (empty if none).
+    """
+    def key(result):
+        return result["graph"], result["size"], result["traversal"]
+
+    old = {key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        before = old.get(key(result))
+        if before is None:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            if metric in before and metric in result and before[metric] > 0:
+                ratio = result[metric] / before[metric]
+                if ratio > 1 + threshold:
+                    regressions.append(f"{' '.join(map(str, key(result)))}: "
+                                       f"{metric} x{ratio:.2f}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--graphs", nargs="+", choices=sorted(GENERATORS), default=list(GENERATORS))
+    parser.add_argument("--traversals", nargs="+", choices=sorted(TRAVERSALS), default=list(TRAVERSALS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write JSON results to this file (default: stdout)")
+    parser.add_argument("--compare", help="earlier JSON results to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.sizes, args.graphs, args.traversals, args.seed, args.repeat)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), report, args.threshold)
+        for message in regressions:
+            print("REGRESSION", message, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,15 @@
 from collections import deque
 
 def bfs_graph(start_node, graph):
-    print("ip:start_node:"+start_node)
+    print(f"ip:start_node:{start_node}")
     print(f"ip:graph:{graph}")
     """
     Perform BFS on a graph.
 
     Parameters:
     - start_node: The starting node for BFS.
-    - graph: The graph represented as an adjacency list (dictionary).
+    - graph: The graph represented as an adjacency list (dictionary),
+      or a CSRGraph from csr_graph.py for large graphs.
 
     Returns:
     - A list of nodes in the order they were visited.
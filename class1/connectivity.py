@@ -0,0 +1,159 @@
+from array import array
+
+from csr_graph import CSRGraph
+
+
+class ConnectivityIndex:
+    """
+    Incremental connectivity index (union-find / disjoint set union).
+
+    Answers "are A and B connected?" for an undirected graph that only ever
+    gains edges, without re-running bfs_graph() after each change. Uses path
+    compression and union by rank, so every operation is effectively O(1)
+    (inverse Ackermann amortised).
+
+    Nodes are interned to integer IDs like in CSRGraph; parents and ranks live
+    in flat arrays rather than per-node objects.
+    """
+
+    def __init__(self):
+        self.index = {}            # label -> ID
+        self.labels = []           # ID -> label
+        self.parent = array('q')
+        self.rank = array('B')     # ranks never exceed log2(n) < 64
+        self.size = array('q')     # only meaningful at roots
+        self.components = 0
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Seed the index from an adjacency dict or a CSRGraph.
+
+        Args:
+            graph: Adjacency dict (node -> neighbours) or CSRGraph.
+
+        Returns:
+            ConnectivityIndex: Index with every node and edge of graph added.
+        """
+        index = cls()
+        if isinstance(graph, CSRGraph):
+            for node_id in range(graph.n):
+                index.add_node(graph.label_of(node_id))
+            for node_id in range(graph.n):
+                for neighbor_id in graph.neighbor_ids(node_id):
+                    index._union(node_id, neighbor_id)
+            return index
+        for node, neighbors in graph.items():
+            for neighbor in neighbors:
+                index.add_edge(node, neighbor)
+            index.add_node(node)
+        return index
+
+    def add_node(self, label):
+        """Add a node as its own component (no-op if it already exists) and return its ID."""
+        node_id = self.index.get(label)
+        if node_id is None:
+            node_id = len(self.labels)
+            self.index[label] = node_id
+            self.labels.append(label)
+            self.parent.append(node_id)
+            self.rank.append(0)
+            self.size.append(1)
+            self.components += 1
+        return node_id
+
+    def _find(self, node_id):
+        """Return the root of node_id, compressing the path on the way back."""
+        parent = self.parent
+        root = node_id
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node_id] != root:
+            parent[node_id], node_id = root, parent[node_id]
+        return root
+
+    def _union(self, a, b):
+        """Merge the components of IDs a and b. Returns True if they were separate."""
+        a = self._find(a)
+        b = self._find(b)
+        if a == b:
+            return False
+        # Attach the shallower tree under the deeper one
+        if self.rank[a] < self.rank[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        if self.rank[a] == self.rank[b]:
+            self.rank[a] += 1
+        self.components -= 1
+        return True
+
+    def add_edge(self, a, b):
+        """
+        Record an undirected edge a - b, adding unseen nodes.
+
+        Returns:
+            bool: True if the edge joined two previously separate components.
+        """
+        return self._union(self.add_node(a), self.add_node(b))
+
+    def connected(self, a, b):
+        """Return True if a and b are in the same component (unknown nodes are not)."""
+        if a not in self.index or b not in self.index:
+            return False
+        return self._find(self.index[a]) == self._find(self.index[b])
+
+    def find(self, label):
+        """Return the label of the representative node of label's component."""
+        return self.labels[self._find(self.index[label])]
+
+    def component_size(self, label):
+        """Number of nodes in the component containing label."""
+        return self.size[self._find(self.index[label])]
+
+    def component_count(self):
+        return self.components
+
+    def component_sizes(self):
+        """Return {representative label: size} for every component."""
+        return {self.labels[i]: self.size[i]
+                for i in range(len(self.labels)) if self.parent[i] == i}
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label):
+        return label in self.index
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    graph = {
+        'A': ['B'],
+        'B': ['A', 'D'],
+        'C': ['F'],
+        'D': ['B'],
+        'E': [],
+        'F': ['C']
+    }
+    index = ConnectivityIndex.from_graph(graph)
+    print("components:", index.component_count(), index.component_sizes())
+    print("A~D:", index.connected('A', 'D'), " A~F:", index.connected('A', 'F'))
+    index.add_edge('D', 'F')
+    print("after adding D-F, A~C:", index.connected('A', 'C'),
+          " size of A's component:", index.component_size('A'))
+
+    # Stream of random edge insertions with a query after each one
+    random.seed(3)
+    n = 1000000
+    index = ConnectivityIndex()
+    for i in range(n):
+        index.add_node(i)
+    start_time = time.time()
+    for _ in range(n):
+        index.add_edge(random.randrange(n), random.randrange(n))
+        index.connected(random.randrange(n), random.randrange(n))
+    print(f"{n} insertions + queries in {time.time() - start_time:.2f} seconds, "
+          f"{index.component_count()} components left")
@@ -0,0 +1,212 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the array module is enough to store the graph
+    np = None
+
+
+class CSRGraph:
+    """
+    Compressed sparse row (CSR) adjacency for large graphs.
+
+    Node labels are interned to dense integer IDs 0..n-1 and the adjacency is
+    stored in two flat buffers:
+      - offsets:   n + 1 entries, the neighbours of node i live in
+                   neighbors[offsets[i]:offsets[i + 1]]
+      - neighbors: one integer ID per edge
+
+    That is 8 bytes per edge instead of a Python string reference plus the
+    list/set overhead of the dict-of-lists format used in bfs.py and dfs.py.
+
+    The object also behaves like a read-only dict of label -> neighbour labels
+    (graph[node], graph.get(node, []), iteration, len), so it can be passed
+    directly to bfs_graph() and dfs() without changing them.
+    """
+
+    def __init__(self, offsets, neighbors, labels=None):
+        """
+        Args:
+            offsets: Buffer of n + 1 edge offsets (array, NumPy array or memoryview).
+            neighbors: Buffer of neighbour IDs, one per edge.
+            labels: Optional sequence of node labels indexed by ID. When None the
+                    integer IDs themselves are the labels.
+        """
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.labels = labels
+        self.n = len(offsets) - 1
+        self.m = len(neighbors)
+        # label -> ID lookup, only needed when labels are not the IDs themselves
+        self.index = None
+        if labels is not None:
+            self.index = {label: i for i, label in enumerate(labels)}
+
+    @classmethod
+    def from_dict(cls, graph):
+        """
+        Build a CSR graph from the adjacency dict format used in class1.
+
+        Args:
+            graph (dict): node -> list/set of neighbour nodes. Neighbours that
+                          never appear as keys are added as nodes without edges.
+
+        Returns:
+            CSRGraph: The same graph with interned labels.
+        """
+        labels = list(graph)
+        index = {label: i for i, label in enumerate(labels)}
+        offsets = array('q', [0])
+        neighbors = array('q')
+        # Only keys have adjacency; labels grows as new neighbours are seen
+        for node in list(graph):
+            for neighbor in graph[node]:
+                if neighbor not in index:
+                    index[neighbor] = len(labels)
+                    labels.append(neighbor)
+                neighbors.append(index[neighbor])
+            offsets.append(len(neighbors))
+        # Nodes that only appeared as neighbours have no outgoing edges
+        offsets.extend([len(neighbors)] * (len(labels) - len(offsets) + 1))
+        return cls(offsets, neighbors, labels)
+
+    @classmethod
+    def from_edges(cls, n, edges, directed=False):
+        """
+        Build a CSR graph over integer nodes 0..n-1 from (u, v) pairs.
+
+        Args:
+            n (int): Number of nodes.
+            edges (iterable): (u, v) pairs.
+            directed (bool): If False every edge is stored in both directions.
+
+        Returns:
+            CSRGraph: Graph whose labels are the integer IDs.
+
+        Raises:
+            ValueError: If an edge endpoint is outside 0..n-1.
+        """
+        sources = array('q')
+        targets = array('q')
+        for u, v in edges:
+            sources.append(u)
+            targets.append(v)
+        return cls.from_arrays(n, sources, targets, directed)
+
+    @classmethod
+    def from_arrays(cls, n, sources, targets, directed=False, labels=None):
+        """
+        Build a CSR graph over integer nodes 0..n-1 from parallel edge arrays.
+
+        Args:
+            n (int): Number of nodes.
+            sources: Sequence of edge source IDs.
+            targets: Sequence of edge target IDs, same length as sources.
+            directed (bool): If False every edge is stored in both directions.
+            labels: Optional sequence of node labels indexed by ID.
+
+        Returns:
+            CSRGraph: Graph labelled by labels, or by the integer IDs.
+
+        Raises:
+            ValueError: If an edge endpoint is outside 0..n-1.
+        """
+        if len(sources) != len(targets):
+            raise ValueError("sources and targets must have the same length")
+        for ends in (sources, targets):
+            if len(ends) and (min(ends) < 0 or max(ends) >= n):
+                raise ValueError(f"edge endpoints must be in 0..{n - 1}")
+        offsets = array('q', bytes(8 * (n + 1)))
+        for u in sources:
+            offsets[u + 1] += 1
+        if not directed:
+            for v in targets:
+                offsets[v + 1] += 1
+        # Prefix sum turns the degree counts into offsets
+        for i in range(1, n + 1):
+            offsets[i] += offsets[i - 1]
+        fill = array('q', offsets[:-1])
+        neighbors = array('q', bytes(8 * offsets[n]))
+        for i in range(len(sources)):
+            u, v = sources[i], targets[i]
+            neighbors[fill[u]] = v
+            fill[u] += 1
+            if not directed:
+                neighbors[fill[v]] = u
+                fill[v] += 1
+        return cls(offsets, neighbors, labels)
+
+    def id_of(self, label):
+        """Return the integer ID of a node label."""
+        return label if self.index is None else self.index[label]
+
+    def label_of(self, node_id):
+        """Return the label of an integer node ID."""
+        return node_id if self.labels is None else self.labels[node_id]
+
+    def neighbor_ids(self, node_id):
+        """Return the neighbour IDs of node_id as a slice of the neighbour buffer."""
+        return self.neighbors[self.offsets[node_id]:self.offsets[node_id + 1]]
+
+    def degree(self, node_id):
+        return self.offsets[node_id + 1] - self.offsets[node_id]
+
+    def as_numpy(self):
+        """
+        Return (offsets, neighbors) as int64 NumPy arrays without copying
+        when the underlying buffers allow it.
+        """
+        if np is None:
+            raise ImportError("as_numpy() requires NumPy")
+        return (np.asarray(self.offsets, dtype=np.int64),
+                np.asarray(self.neighbors, dtype=np.int64))
+
+    def nbytes(self):
+        """Approximate size of the adjacency buffers in bytes."""
+        return (len(self.offsets) + len(self.neighbors)) * 8
+
+    # --- dict-like view over labels, used by bfs_graph() and dfs() ---
+
+    def __getitem__(self, label):
+        if label not in self:
+            raise KeyError(label)
+        node_id = self.id_of(label)
+        return [self.label_of(i) for i in self.neighbor_ids(node_id)]
+
+    def get(self, label, default=None):
+        try:
+            return self[label]
+        except KeyError:
+            return default
+
+    def __contains__(self, label):
+        if self.index is not None:
+            return label in self.index
+        return isinstance(label, int) and 0 <= label < self.n
+
+    def __iter__(self):
+        return iter(self.labels if self.labels is not None else range(self.n))
+
+    def __len__(self):
+        return self.n
+
+    def __repr__(self):
+        # Keep this short: bfs_graph() prints the graph on every step
+        return f"CSRGraph(n={self.n}, m={self.m})"
+
+
+if __name__ == "__main__":
+    graph = {
+        'A': ['B', 'C'],
+        'B': ['A', 'D', 'E'],
+        'C': ['A', 'F'],
+        'D': ['B'],
+        'E': ['B', 'F'],
+        'F': ['C', 'E']
+    }
+    csr = CSRGraph.from_dict(graph)
+    print(csr)
+    print("offsets:", list(csr.offsets))
+    print("neighbors:", list(csr.neighbors))
+    print("B ->", csr['B'])
+    print("adjacency bytes:", csr.nbytes())
@@ -8,13 +8,14 @@ graph1 = {
     }
 print("Ammen Ramali: ")
 def dfs(graph, node, visited):
+    # graph can be a dict of sets/lists or a CSRGraph from csr_graph.py
     if node not in visited:
-        print("node:"+node)
+        print(f"node:{node}")
         print(f"visited:{visited}")
         visited.append(node)
         print(f"set value: {graph[node]}")
         for n in graph[node]:
-            print("n:"+n)
+            print(f"n:{n}")
             dfs(graph,n,visited)
     print(f"visited_ before returned:{visited}")
     return visited
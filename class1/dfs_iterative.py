@@ -0,0 +1,114 @@
+from csr_graph import CSRGraph
+
+PRE = "pre"
+POST = "post"
+
+
+def iter_dfs(graph, start, events=False):
+    """
+    Non-recursive depth-first search that yields nodes lazily.
+
+    Visits nodes in the same order as the recursive dfs() in dfs.py, but keeps
+    an explicit stack instead of the call stack, so a 10k (or 10M) node path
+    does not hit the recursion limit. Visited nodes are kept in a set (or a
+    bytearray bitmap for a CSRGraph), so each membership test is O(1) and the
+    whole traversal is O(n + m).
+
+    Because this is a generator, the caller can stop early (break out of the
+    loop) and the rest of the graph is never explored.
+
+    Args:
+        graph: Adjacency dict (node -> list/set of neighbours) or a CSRGraph.
+        start: Node to start from.
+        events (bool): If False yield nodes in pre-order. If True yield
+                       ("pre", node) when a node is first entered and
+                       ("post", node) once all its descendants are finished.
+
+    Yields:
+        node, or (event, node) tuples when events is True.
+    """
+    if isinstance(graph, CSRGraph):
+        yield from _iter_dfs_csr(graph, start, events)
+        return
+
+    visited = {start}
+    yield (PRE, start) if events else start
+    # Each stack entry is a node plus an iterator over its remaining neighbours
+    stack = [(start, iter(graph.get(start, ())))]
+    while stack:
+        node, neighbors = stack[-1]
+        for neighbor in neighbors:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                yield (PRE, neighbor) if events else neighbor
+                stack.append((neighbor, iter(graph.get(neighbor, ()))))
+                break
+        else:
+            # All neighbours done: this node is finished
+            stack.pop()
+            if events:
+                yield (POST, node)
+
+
+def _iter_dfs_csr(graph, start, events):
+    """iter_dfs() over a CSRGraph using integer IDs and a visited bitmap."""
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    label_of = graph.label_of
+    visited = bytearray(graph.n)
+
+    start_id = graph.id_of(start)
+    visited[start_id] = 1
+    yield (PRE, start) if events else start
+    # Parallel stacks: node ID and the offset of the next neighbour to try
+    node_stack = [start_id]
+    pos_stack = [offsets[start_id]]
+    while node_stack:
+        node = node_stack[-1]
+        pos = pos_stack[-1]
+        end = offsets[node + 1]
+        while pos < end and visited[neighbors[pos]]:
+            pos += 1
+        if pos < end:
+            child = neighbors[pos]
+            pos_stack[-1] = pos + 1
+            visited[child] = 1
+            yield (PRE, label_of(child)) if events else label_of(child)
+            node_stack.append(child)
+            pos_stack.append(offsets[child])
+        else:
+            node_stack.pop()
+            pos_stack.pop()
+            if events:
+                yield (POST, label_of(node))
+
+
+def dfs_order(graph, start):
+    """Return the full pre-order visit list, like dfs(graph, start, [])."""
+    return list(iter_dfs(graph, start))
+
+
+if __name__ == "__main__":
+    graph1 = {
+        'A': ['B', 'C'],
+        'B': ['A', 'D', 'E'],
+        'C': ['A', 'F'],
+        'D': ['B'],
+        'E': ['B', 'F'],
+        'F': ['C', 'E'],
+    }
+    print("DFS order:", dfs_order(graph1, 'A'))
+    for event, node in iter_dfs(graph1, 'A', events=True):
+        print(event, node)
+
+    # A long path graph that the recursive dfs() cannot handle
+    n = 100000
+    path = CSRGraph.from_edges(n, [(i, i + 1) for i in range(n - 1)])
+    order = dfs_order(path, 0)
+    print(f"Path graph with {n} nodes: visited {len(order)}, last node {order[-1]}")
+
+    # Stop early: only the first 5 nodes are ever explored
+    for i, node in enumerate(iter_dfs(path, 0)):
+        if i == 4:
+            print("Stopped early at node", node)
+            break
@@ -0,0 +1,184 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from csr_graph import CSRGraph
+
+# File layout (little-endian, everything 8-byte aligned):
+#   header     40 bytes: magic, version, flags, n, m, labels_offset, padding
+#   offsets    (n + 1) int64
+#   neighbors  m int64
+#   labels     optional, either n int64 labels (FLAG_INT_LABELS) or
+#              (n + 1) int64 byte offsets followed by the UTF-8 labels
+MAGIC = b"CSRG"
+VERSION = 2
+HEADER = struct.Struct("<4sIIQQQ4x")
+FLAG_LABELS = 1
+FLAG_INT_LABELS = 2
+
+
+def _encode_labels(labels):
+    """Return (flags, bytes) for a label list; only str or int labels round-trip exactly."""
+    if all(type(label) is int for label in labels):
+        return FLAG_LABELS | FLAG_INT_LABELS, array('q', labels).tobytes()
+    offsets = array('q', [0])
+    encoded = []
+    for label in labels:
+        if type(label) is not str:
+            raise ValueError(f"labels must be all str or all int, got {label!r}")
+        encoded.append(label.encode("utf-8"))
+        offsets.append(offsets[-1] + len(encoded[-1]))
+    return FLAG_LABELS, offsets.tobytes() + b"".join(encoded)
+
+
+def _decode_labels(view, flags, n):
+    if flags & FLAG_INT_LABELS:
+        return view[:8 * n].cast('q').tolist()
+    offsets = view[:8 * (n + 1)].cast('q')
+    data = bytes(view[8 * (n + 1):])
+    return [data[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(n)]
+
+
+def write_graph(path, graph):
+    """
+    Write a CSRGraph (or adjacency dict) to the binary graph format.
+
+    Args:
+        path (str): Output file path.
+        graph: CSRGraph or adjacency dict. Labels must be all str or all
+               int so they read back unchanged; anything else raises ValueError.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_dict(graph)
+    offsets = array('q', graph.offsets)
+    neighbors = array('q', graph.neighbors)
+    flags, labels = 0, b""
+    if graph.labels is not None:
+        flags, labels = _encode_labels(graph.labels)
+    labels_offset = HEADER.size + 8 * (len(offsets) + len(neighbors))
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, flags, graph.n, graph.m, labels_offset))
+        offsets.tofile(f)
+        neighbors.tofile(f)
+        f.write(labels)
+
+
+def convert_edge_list(text_path, out_path, directed=False, numeric=False):
+    """
+    Convert a text edge list ("u v" per line, '#' starts a comment) to the
+    binary graph format.
+
+    Args:
+        text_path (str): Input edge list.
+        out_path (str): Output binary file.
+        directed (bool): If False each edge is stored in both directions.
+        numeric (bool): If True node names are integers used directly as IDs
+                        and no label table is written. Otherwise names are
+                        interned to IDs in order of first appearance.
+
+    Returns:
+        tuple: (n, m) node and stored edge counts.
+    """
+    sources = array('q')
+    targets = array('q')
+    labels = None if numeric else []
+    index = {}
+    n = 0
+    with open(text_path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.split("#", 1)[0].split()
+            if not line:
+                continue
+            if len(line) != 2:
+                raise ValueError(f"expected 'u v' in edge list, got {line!r}")
+            if numeric:
+                u, v = int(line[0]), int(line[1])
+                if u < 0 or v < 0:
+                    raise ValueError(f"negative node ID on line {line_number}: {line!r}")
+                n = max(n, u + 1, v + 1)
+            else:
+                for name in line:
+                    if name not in index:
+                        index[name] = len(labels)
+                        labels.append(name)
+                u, v = index[line[0]], index[line[1]]
+            sources.append(u)
+            targets.append(v)
+    if not numeric:
+        n = len(labels)
+
+    graph = CSRGraph.from_arrays(n, sources, targets, directed, labels)
+    write_graph(out_path, graph)
+    return graph.n, graph.m
+
+
+def open_graph(path):
+    """
+    Memory-map a binary graph file and return it as a CSRGraph.
+
+    Offsets and neighbors are views straight into the mapping, so the OS only
+    pages in the parts of the graph a traversal actually touches. Opening is
+    only instant for unlabelled files (convert_edge_list(numeric=True)): a
+    label table is decoded in full and CSRGraph builds a label -> ID dict from
+    it, which costs time and memory proportional to the number of nodes.
+
+    Args:
+        path (str): File written by write_graph() or convert_edge_list().
+
+    Returns:
+        CSRGraph: Read-only graph backed by the file.
+    """
+    if sys.byteorder != "little":
+        raise ValueError("the binary graph format is little-endian only")
+    with open(path, "rb") as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, flags, n, m, labels_offset = HEADER.unpack_from(mapping, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a binary graph file")
+    if version != VERSION:
+        raise ValueError(f"unsupported graph file version {version}")
+
+    view = memoryview(mapping)
+    offsets_end = HEADER.size + 8 * (n + 1)
+    offsets = view[HEADER.size:offsets_end].cast('q')
+    neighbors = view[offsets_end:offsets_end + 8 * m].cast('q')
+    labels = None
+    if flags & FLAG_LABELS:
+        labels = _decode_labels(view[labels_offset:], flags, n)
+    return CSRGraph(offsets, neighbors, labels)
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    import numpy as np
+
+    from bfs_levels import bfs_levels
+    from dfs_iterative import dfs_order
+
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = os.path.join(tmp, "graph.txt")
+        bin_path = os.path.join(tmp, "graph.csrg")
+        with open(text_path, "w") as f:
+            f.write("# the six node graph from bfs.py\n")
+            f.write("A B\nA C\nB D\nB E\nC F\nE F\n")
+        print("converted (n, m):", convert_edge_list(text_path, bin_path))
+        graph = open_graph(bin_path)
+        print(graph, "DFS from A:", dfs_order(graph, 'A'))
+
+        # A larger numeric edge list
+        n = 1000000
+        rng = np.random.default_rng(1)
+        with open(text_path, "w") as f:
+            for u, v in rng.integers(0, n, size=(2 * n, 2)).tolist():
+                f.write(f"{u} {v}\n")
+        convert_edge_list(text_path, bin_path, numeric=True)
+        start_time = time.time()
+        graph = open_graph(bin_path)
+        print(f"opened {graph} in {time.time() - start_time:.4f} seconds")
+        distance, _ = bfs_levels(graph, n // 2)
+        print("BFS distance from the middle to node 0:", distance[0])
+        del graph, distance
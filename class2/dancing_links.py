@@ -0,0 +1,284 @@
+import time
+from array import array
+
+
+class ExactCover:
+    """
+    Algorithm X with Dancing Links (DLX) for exact cover problems.
+
+    Every 1 in the exact cover matrix is a node, and nodes live in a pool of
+    parallel integer arrays (left, right, up, down, column) indexed by node
+    number rather than as Python objects. Node 0 is the root and nodes
+    1..columns are the column headers.
+
+    Primary columns must be covered exactly once. Secondary columns may be
+    covered at most once; they are never chosen for branching, which is what
+    N-Queens needs for its diagonals.
+    """
+
+    def __init__(self, primary, secondary=0):
+        """
+        Args:
+            primary (int): Number of primary columns, numbered 0..primary-1.
+            secondary (int): Number of secondary columns, numbered after them.
+        """
+        if primary < 0 or secondary < 0:
+            raise ValueError("column counts must not be negative")
+        columns = primary + secondary
+        headers = range(columns + 1)
+        self.primary = primary
+        self.columns = columns
+        self.left = array('i', headers)
+        self.right = array('i', headers)
+        self.up = array('i', headers)
+        self.down = array('i', headers)
+        self.column = array('i', headers)
+        self.row_of = array('i', [-1] * (columns + 1))
+        self.size = array('i', [0] * (columns + 1))
+        self.rows = []          # first node of each row
+        self._chosen = []       # rows fixed with select()
+        self._taken = set()     # column headers covered by those rows
+
+        # Link root and primary headers into a circular list; secondary
+        # headers point to themselves so the search never picks them
+        for c in range(primary + 1):
+            self.left[c] = c - 1 if c else primary
+            self.right[c] = c + 1 if c < primary else 0
+
+    def add_row(self, columns):
+        """
+        Add a row covering the given column numbers.
+
+        Returns:
+            int: The row's number, as reported in solutions.
+        """
+        row = len(self.rows)
+        first = len(self.column)
+        for i, col in enumerate(columns):
+            node = first + i
+            header = col + 1
+            self.column.append(header)
+            self.row_of.append(row)
+            # Insert at the bottom of the column
+            self.up.append(self.up[header])
+            self.down.append(header)
+            self.down[self.up[header]] = node
+            self.up[header] = node
+            self.size[header] += 1
+            # Insert into the row's circular list
+            self.left.append(node - 1 if i else node)
+            self.right.append(first)
+            if i:
+                self.right[node - 1] = node
+                self.left[first] = node
+        self.rows.append(first)
+        return row
+
+    def _cover(self, c):
+        left, right, up, down, column, size = (self.left, self.right, self.up,
+                                               self.down, self.column, self.size)
+        right[left[c]] = right[c]
+        left[right[c]] = left[c]
+        i = down[c]
+        while i != c:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def _uncover(self, c):
+        left, right, up, down, column, size = (self.left, self.right, self.up,
+                                               self.down, self.column, self.size)
+        i = up[c]
+        while i != c:
+            j = left[i]
+            while j != i:
+                size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[c]] = c
+        left[right[c]] = c
+
+    def _cover_row(self, node):
+        j = self.right[node]
+        while j != node:
+            self._cover(self.column[j])
+            j = self.right[j]
+
+    def _uncover_row(self, node):
+        j = self.left[node]
+        while j != node:
+            self._uncover(self.column[j])
+            j = self.left[j]
+
+    def select(self, row):
+        """
+        Force a row into every solution (e.g. a pre-placed queen).
+
+        Returns:
+            bool: False if the row clashes with an already selected row.
+        """
+        node = self.rows[row]
+        headers = [self.column[node]]
+        j = self.right[node]
+        while j != node:
+            headers.append(self.column[j])
+            j = self.right[j]
+        if self._taken.intersection(headers):
+            return False
+        self._taken.update(headers)
+        self._cover(self.column[node])
+        self._cover_row(node)
+        self._chosen.append(node)
+        return True
+
+    def _choose_column(self):
+        """Primary column with the fewest remaining rows (Knuth's S heuristic)."""
+        right, size = self.right, self.size
+        best = right[0]
+        c = right[best]
+        while c != 0:
+            if size[c] < size[best]:
+                best = c
+                if size[c] <= 1:
+                    break
+            c = right[c]
+        return best
+
+    def solutions(self):
+        """
+        Yield every exact cover as a list of row numbers.
+
+        The search uses an explicit stack of chosen nodes instead of
+        recursion. Rows passed to select() are included in each solution.
+        The matrix is restored when the generator finishes or is closed.
+        """
+        right, down, column, row_of = self.right, self.down, self.column, self.row_of
+        fixed = [row_of[node] for node in self._chosen]
+        chosen = []
+        descending = True
+        try:
+            while True:
+                if descending:
+                    if right[0] == 0:
+                        yield fixed + [row_of[node] for node in chosen]
+                        descending = False
+                        continue
+                    c = self._choose_column()
+                    self._cover(c)
+                    node = down[c]
+                    if node == c:
+                        # Dead end: no row left for this column
+                        self._uncover(c)
+                        descending = False
+                        continue
+                    chosen.append(node)
+                    self._cover_row(node)
+                else:
+                    if not chosen:
+                        return
+                    node = chosen.pop()
+                    self._uncover_row(node)
+                    c = column[node]
+                    node = down[node]
+                    if node == c:
+                        self._uncover(c)
+                        continue
+                    chosen.append(node)
+                    self._cover_row(node)
+                    descending = True
+        finally:
+            # Restore the links if the caller stopped early, so the problem
+            # can be searched again
+            while chosen:
+                node = chosen.pop()
+                self._uncover_row(node)
+                self._uncover(column[node])
+
+    def first_solution(self):
+        """Return the first exact cover found, or None."""
+        for solution in self.solutions():
+            return solution
+        return None
+
+    def count(self):
+        """Count all exact covers."""
+        return sum(1 for _ in self.solutions())
+
+
+def nqueens_cover(n, placed=()):
+    """
+    Encode N-Queens (with optional pre-placed queens) as exact cover.
+
+    Primary columns are the n rows and n columns of the board, secondary
+    columns the 2n - 1 diagonals in each direction. Matrix row r * n + c is
+    a queen on square (r, c).
+
+    Args:
+        n (int): Board size.
+        placed (iterable): (row, col) squares that must hold a queen.
+
+    Returns:
+        ExactCover: The problem, or None if n < 1 or the pre-placed queens
+                    attack each other.
+    """
+    if n < 1:
+        return None
+    problem = ExactCover(2 * n, 2 * (2 * n - 1))
+    for r in range(n):
+        for c in range(n):
+            problem.add_row((r, n + c, 2 * n + r + c, 2 * n + (2 * n - 1) + r - c + n - 1))
+    # The same square listed twice is one queen, not a clash
+    for r, c in dict.fromkeys(placed):
+        if not (0 <= r < n and 0 <= c < n) or not problem.select(r * n + c):
+            return None
+    return problem
+
+
+def _to_columns(n, solution):
+    board = bytearray(n)
+    for square in solution:
+        board[square // n] = square % n
+    return bytes(board)
+
+
+def complete_nqueens(n, placed=()):
+    """
+    Find one N-Queens solution that contains the pre-placed queens.
+
+    Returns:
+        bytes: board[row] = column, or None if no completion exists.
+    """
+    problem = nqueens_cover(n, placed)
+    solution = problem and problem.first_solution()
+    return None if solution is None else _to_columns(n, solution)
+
+
+def count_nqueens_completions(n, placed=()):
+    """Count the N-Queens solutions that contain the pre-placed queens."""
+    problem = nqueens_cover(n, placed)
+    return 0 if problem is None else problem.count()
+
+
+if __name__ == "__main__":
+    # Knuth's example matrix from the Dancing Links paper
+    problem = ExactCover(7)
+    for row in ([2, 4, 5], [0, 3, 6], [1, 2, 5], [0, 3], [1, 6], [3, 4, 6]):
+        problem.add_row(row)
+    print("Exact cover rows:", problem.first_solution())
+
+    print("8-queens solutions:", count_nqueens_completions(8))
+    placed = [(0, 0), (1, 4)]
+    print(f"8-queens completions of {placed}:", count_nqueens_completions(8, placed))
+    board = complete_nqueens(8, placed)
+    for col in board:
+        print(" ".join("Q" if c == col else "." for c in range(8)))
+
+    start_time = time.time()
+    board = complete_nqueens(40, [(0, 10), (5, 20), (17, 3)])
+    print(f"40-queens completion: {list(board)} in {time.time() - start_time:.2f} seconds")
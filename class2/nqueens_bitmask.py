@@ -0,0 +1,157 @@
+import time
+
+
+def prefix_masks(n, prefix):
+    """
+    Compute the attack masks after placing queens for the first rows.
+
+    Bit c of a mask stands for column c of the next row:
+      - cols:  columns already holding a queen
+      - left:  squares attacked along "/" diagonals
+      - right: squares attacked along "\\" diagonals
+
+    Args:
+        n (int): Board size.
+        prefix (sequence): Column of the queen in each of the first rows.
+
+    Returns:
+        tuple: (cols, left, right) masks, or None if the prefix is not a
+               valid partial placement.
+    """
+    full = (1 << n) - 1
+    cols = left = right = 0
+    for col in prefix:
+        if not 0 <= col < n:
+            return None
+        bit = 1 << col
+        if (cols | left | right) & bit:
+            return None
+        cols |= bit
+        left = ((left | bit) << 1) & full
+        right = (right | bit) >> 1
+    return cols, left, right
+
+
+def _count(full, cols, left, right):
+    """Count completions of a partial placement given by its attack masks."""
+    if cols == full:
+        return 1
+    free = full & ~(cols | left | right)
+    total = 0
+    while free:
+        bit = free & -free      # lowest free column
+        free ^= bit
+        total += _count(full, cols | bit, ((left | bit) << 1) & full, (right | bit) >> 1)
+    return total
+
+
+def count_completions(n, prefix=()):
+    """
+    Count the N-Queens solutions that start with the given rows.
+
+    Args:
+        n (int): Board size.
+        prefix (sequence): Columns of the queens already placed in rows 0, 1, ...
+
+    Returns:
+        int: Number of solutions extending the prefix (0 if it is invalid).
+    """
+    masks = prefix_masks(n, prefix)
+    if masks is None:
+        return 0
+    return _count((1 << n) - 1, *masks)
+
+
+def count_n_queens(n):
+    """
+    Count all N-Queens solutions without building any boards.
+
+    Columns and both diagonal directions are kept as integer bitmasks, so the
+    safety check that solve_n_queens() does with three set lookups becomes a
+    single AND, and the free columns of a row are iterated by repeatedly
+    taking the lowest set bit.
+
+    Args:
+        n (int): Board size.
+
+    Returns:
+        int: Number of distinct solutions, 0 for n < 1.
+    """
+    if n < 1:
+        return 0
+    return _count((1 << n) - 1, 0, 0, 0)
+
+
+def iter_solutions(n, prefix=()):
+    """
+    Yield every solution as a tuple of columns, one per row.
+
+    Uses an explicit stack of free-column masks instead of recursion, so the
+    caller can stop at any time and nothing is kept besides the current
+    partial placement.
+
+    Args:
+        n (int): Board size.
+        prefix (sequence): Optional fixed columns for the first rows.
+
+    Yields:
+        tuple: board where board[row] is the column of the queen in that row.
+    """
+    masks = prefix_masks(n, prefix)
+    if n < 1 or masks is None:
+        return
+    full = (1 << n) - 1
+    board = list(prefix)
+    cols, left, right = masks
+    if cols == full:
+        yield tuple(board)
+        return
+    # One entry per row being filled: the masks it was entered with and the
+    # columns it still has to try
+    stack = [(cols, left, right, full & ~(cols | left | right))]
+    while stack:
+        cols, left, right, free = stack[-1]
+        if not free:
+            stack.pop()
+            continue
+        bit = free & -free
+        stack[-1] = (cols, left, right, free ^ bit)
+        # Drop whatever deeper rows were placed before, then place this row
+        del board[len(prefix) + len(stack) - 1:]
+        board.append(bit.bit_length() - 1)
+        cols |= bit
+        if cols == full:
+            yield tuple(board)
+            continue
+        left = ((left | bit) << 1) & full
+        right = (right | bit) >> 1
+        stack.append((cols, left, right, full & ~(cols | left | right)))
+
+
+def format_board(solution):
+    """Turn a column tuple into the list-of-strings format of solve_n_queens()."""
+    n = len(solution)
+    return ["." * col + "Q" + "." * (n - col - 1) for col in solution]
+
+
+def solve_n_queens(n):
+    """
+    Faster version of solve_n_queens() in nqueens_gemini.py, with the same
+    output for n >= 1. For n = 0 it returns [] where the original returns
+    [[]] (one empty board), matching count_n_queens(0) == 0.
+
+    Returns:
+        list: All solutions as lists of strings ('Q' for a queen, '.' otherwise).
+    """
+    return [format_board(solution) for solution in iter_solutions(n)]
+
+
+if __name__ == "__main__":
+    for solution in solve_n_queens(4):
+        print("\n".join(solution))
+        print("-" * 11)
+
+    for n in range(1, 14):
+        start_time = time.time()
+        count = count_n_queens(n)
+        print(f"N={n:2d}: {count:8d} solutions in {time.time() - start_time:.3f} seconds")
@@ -0,0 +1,195 @@
+"""
+Resumable N-Queens counting.
+
+The search is partitioned into work units (fixed prefixes of the first few
+rows). Finished units and their counts are saved to a JSON checkpoint file,
+so an interrupted run picks up where it stopped. Units can also be split into
+shards that separate processes or machines run with their own checkpoint
+files, to be merged at the end.
+
+Usage:
+    python nqueens_checkpoint.py 16 --checkpoint q16.json
+    python nqueens_checkpoint.py 19 --checkpoint q19-0.json --shard 0/4
+    python nqueens_checkpoint.py 19 --merge q19-0.json q19-1.json q19-2.json q19-3.json
+"""
+import argparse
+import json
+import os
+import time
+from multiprocessing import Pool, cpu_count
+
+from nqueens_bitmask import count_completions, prefix_masks
+from nqueens_parallel import work_units
+
+
+def partition(n, depth=3, symmetric=True):
+    """
+    Split the search into (prefix, weight) units fixing the first depth rows.
+
+    Starts from the two-row units of work_units() and extends each prefix
+    with every valid placement for the following rows. The order is
+    deterministic, so a unit's position in the list identifies it across runs.
+
+    Args:
+        n (int): Board size.
+        depth (int): Rows fixed per unit (at least 2). Deeper means more,
+                     smaller units and finer-grained checkpoints.
+        symmetric (bool): Use the mirror symmetry, as in work_units().
+
+    Returns:
+        list: (prefix, weight) pairs.
+    """
+    units = work_units(n, symmetric)
+    for _ in range(2, min(depth, n)):
+        units = [(prefix + (col,), weight)
+                 for prefix, weight in units
+                 for col in range(n)
+                 if prefix_masks(n, prefix + (col,)) is not None]
+    return units
+
+
+def load_checkpoint(path):
+    """Return the saved state, or None if the checkpoint file does not exist."""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_checkpoint(path, state):
+    """Write the state atomically, so a crash mid-write never corrupts it."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def _count_unit(args):
+    index, n, prefix, weight = args
+    return index, weight * count_completions(n, prefix)
+
+
+def count_resumable(n, checkpoint_path, depth=3, processes=None, save_every=30.0,
+                    shard=(0, 1), symmetric=True):
+    """
+    Count N-Queens solutions, checkpointing finished work units to disk.
+
+    Args:
+        n (int): Board size.
+        checkpoint_path (str): JSON checkpoint file, created or resumed.
+        depth (int): Rows fixed per work unit, see partition().
+        processes (int): Worker count, defaults to the number of CPUs.
+        save_every (float): Seconds between checkpoint writes.
+        shard (tuple): (index, count): only run units where
+                       unit_number % count == index.
+        symmetric (bool): Use the mirror symmetry.
+
+    Returns:
+        int: Number of solutions covered by this shard.
+
+    Raises:
+        ValueError: If the shard is not 0 <= index < count, or the checkpoint
+                    was written with different settings.
+    """
+    shard_index, shard_count = shard
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(f"shard index must be in 0..count-1, got {shard_index}/{shard_count}")
+    settings = {"n": n, "depth": depth, "symmetric": symmetric, "shard": list(shard)}
+    state = load_checkpoint(checkpoint_path)
+    if state is None:
+        state = dict(settings, done={})
+    elif any(state[key] != value for key, value in settings.items()):
+        raise ValueError(f"{checkpoint_path} was written with different settings: "
+                         f"{ {key: state[key] for key in settings} }")
+
+    units = [(index, n, prefix, weight)
+             for index, (prefix, weight) in enumerate(partition(n, depth, symmetric))
+             if index % shard_count == shard_index]
+    state["units"] = len(units)
+    done = state["done"]
+    pending = [unit for unit in units if str(unit[0]) not in done]
+
+    last_save = time.time()
+    try:
+        if pending:
+            with Pool(processes or cpu_count()) as pool:
+                for index, count in pool.imap_unordered(_count_unit, pending):
+                    done[str(index)] = count
+                    if time.time() - last_save >= save_every:
+                        save_checkpoint(checkpoint_path, state)
+                        last_save = time.time()
+    finally:
+        # Also runs on Ctrl-C, so at most the units in flight are lost
+        save_checkpoint(checkpoint_path, state)
+    return sum(done.values())
+
+
+def merge_checkpoints(paths, n=None):
+    """
+    Combine the checkpoints of all shards of one run.
+
+    Args:
+        paths (list): Checkpoint file of every shard.
+        n (int): Expected board size, or None to accept the shards' own.
+
+    Returns:
+        int: Total number of solutions.
+
+    Raises:
+        ValueError: If a shard is missing or unfinished, or the shards were
+                    written with different settings or for another n.
+    """
+    states = [load_checkpoint(path) for path in paths]
+    if any(state is None for state in states):
+        raise ValueError("missing checkpoint file")
+    settings = [{"n": state["n"], "depth": state["depth"], "symmetric": state["symmetric"],
+                 "shards": state["shard"][1]} for state in states]
+    for path, shard_settings in zip(paths, settings):
+        if shard_settings != settings[0]:
+            raise ValueError(f"{path} was written with different settings: "
+                             f"{shard_settings} vs {settings[0]}")
+    if n is not None and settings[0]["n"] != n:
+        raise ValueError(f"checkpoints are for N={settings[0]['n']}, not N={n}")
+    shard_count = settings[0]["shards"]
+    if sorted(state["shard"][0] for state in states) != list(range(shard_count)):
+        raise ValueError(f"expected one checkpoint for each of {shard_count} shards")
+    for path, state in zip(paths, states):
+        if len(state["done"]) != state["units"]:
+            raise ValueError(f"{path}: {len(state['done'])} of {state['units']} units done")
+    return sum(sum(state["done"].values()) for state in states)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resumable N-Queens solution counting")
+    parser.add_argument("n", type=int)
+    parser.add_argument("--checkpoint", help="checkpoint file (default: queens<N>.json)")
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--processes", type=int)
+    parser.add_argument("--save-every", type=float, default=30.0)
+    parser.add_argument("--shard", default="0/1", help="index/count, e.g. 2/4")
+    parser.add_argument("--merge", nargs="+", metavar="CHECKPOINT",
+                        help="add up the checkpoints of finished shards instead of counting")
+    args = parser.parse_args(argv)
+
+    if args.merge:
+        print(f"N={args.n}: {merge_checkpoints(args.merge, args.n)} solutions")
+        return
+    try:
+        shard_index, shard_count = (int(part) for part in args.shard.split("/"))
+    except ValueError:
+        parser.error(f"--shard must be index/count, got {args.shard!r}")
+    if not 0 <= shard_index < shard_count:
+        parser.error(f"--shard index must be in 0..count-1, got {args.shard}")
+    shard = (shard_index, shard_count)
+    checkpoint = args.checkpoint or f"queens{args.n}.json"
+    start_time = time.time()
+    count = count_resumable(args.n, checkpoint, args.depth, args.processes,
+                            args.save_every, shard)
+    state = load_checkpoint(checkpoint)
+    print(f"N={args.n} shard {args.shard}: {count} solutions, "
+          f"{len(state['done'])}/{state['units']} units done, "
+          f"{time.time() - start_time:.2f} seconds this run")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import random
+import time
+from array import array
+
+
+def _attacks(d1, d2, offset, row, col):
+    """Number of other queens on the two diagonals through (row, col)."""
+    return d1[row + col] + d2[row - col + offset] - 2
+
+
+def _place(d1, d2, offset, row, col, delta):
+    """Add (delta=1) or remove (delta=-1) a queen at (row, col) in the diagonal counters."""
+    d1[row + col] += delta
+    d2[row - col + offset] += delta
+
+
+def solve_min_conflicts(n, seed=None, max_swaps=None, tries=10):
+    """
+    Find one N-Queens placement with min-conflicts local search.
+
+    The board is kept as a permutation (board[row] = column), so rows and
+    columns never clash and only the diagonals need checking. Two arrays of
+    per-diagonal queen counters make "how many queens attack this square"
+    an O(1) lookup instead of the O(N) scan of is_safe() in nqueens.py.
+
+    1. Greedy start: row by row, swap in a random not-yet-used column whose
+       diagonals are still free (up to 200 random tries). This leaves only
+       a few dozen conflicting queens even for N = 1,000,000.
+    2. Repair: for every queen still under attack, try swapping its column
+       with a random other row and keep the swap unless it increases the
+       number of conflicts. Sideways moves, plus an occasional uphill move
+       after 500 swaps without progress, let small boards escape local
+       minima.
+
+    Args:
+        n (int): Board size. There is no solution for n = 2 or 3.
+        seed: Random seed for reproducible runs.
+        max_swaps (int): Swap attempts per try before restarting,
+                         default max(100 * n, 10000).
+        tries (int): Restarts before giving up.
+
+    Returns:
+        array: Compact column array (typecode 'i'), or None if no placement
+               was found.
+    """
+    if n in (2, 3) or n < 1:
+        return None
+    rng = random.Random(seed)
+    if max_swaps is None:
+        max_swaps = max(100 * n, 10000)
+    for _ in range(tries):
+        board = _search(n, rng, max_swaps)
+        if board is not None:
+            return board
+    return None
+
+
+def _search(n, rng, max_swaps):
+    randrange = rng.randrange
+    uniform = rng.random
+    offset = n - 1
+    board = array('i', range(n))
+    d1 = array('i', bytes(4 * (2 * n - 1)))    # "/" diagonals, index row + col
+    d2 = array('i', bytes(4 * (2 * n - 1)))    # "\" diagonals, index row - col + n - 1
+
+    # 1. Greedy start
+    for row in range(n):
+        for _ in range(200):
+            j = randrange(row, n)
+            col = board[j]
+            if not d1[row + col] and not d2[row - col + offset]:
+                break
+        board[row], board[j] = col, board[row]
+        _place(d1, d2, offset, row, col, 1)
+
+    # 2. Repair the queens that are still attacked
+    conflicted = [row for row in range(n) if _attacks(d1, d2, offset, row, board[row])]
+    swaps = 0
+    stalled = 0     # swaps tried since the last strict improvement
+    while conflicted:
+        still_conflicted = []
+        for i in conflicted:
+            ci = board[i]
+            if not _attacks(d1, d2, offset, i, ci):
+                continue
+            j = randrange(n)
+            cj = board[j]
+            if i == j:
+                still_conflicted.append(i)
+                continue
+            before = _attacks(d1, d2, offset, i, ci) + _attacks(d1, d2, offset, j, cj)
+            # Swap the two queens' columns and update the counters
+            _place(d1, d2, offset, i, ci, -1)
+            _place(d1, d2, offset, j, cj, -1)
+            _place(d1, d2, offset, i, cj, 1)
+            _place(d1, d2, offset, j, ci, 1)
+            after = _attacks(d1, d2, offset, i, cj) + _attacks(d1, d2, offset, j, ci)
+            if after <= before or (stalled > 500 and uniform() < 0.05):
+                board[i], board[j] = cj, ci
+                if after < before:
+                    stalled = 0
+                if _attacks(d1, d2, offset, i, cj):
+                    still_conflicted.append(i)
+                if _attacks(d1, d2, offset, j, ci):
+                    still_conflicted.append(j)
+            else:
+                # Makes things worse, undo it
+                _place(d1, d2, offset, i, cj, -1)
+                _place(d1, d2, offset, j, ci, -1)
+                _place(d1, d2, offset, i, ci, 1)
+                _place(d1, d2, offset, j, cj, 1)
+                still_conflicted.append(i)
+            swaps += 1
+            stalled += 1
+            if swaps > max_swaps:
+                return None
+        # A row can be queued twice (once as i, once as a random j)
+        conflicted = list(dict.fromkeys(still_conflicted))
+        if not conflicted:
+            # A swap can also move a queen onto the diagonal of a third queen
+            # that was not on the list, so confirm with a full scan
+            conflicted = [row for row in range(n) if _attacks(d1, d2, offset, row, board[row])]
+    return board
+
+
+def is_valid(board):
+    """Check a column array: one queen per row and column, no shared diagonals."""
+    n = len(board)
+    return (len(set(board)) == n
+            and len({row + col for row, col in enumerate(board)}) == n
+            and len({row - col for row, col in enumerate(board)}) == n)
+
+
+if __name__ == "__main__":
+    board = solve_min_conflicts(8, seed=1)
+    for col in board:
+        print(" ".join("Q" if c == col else "." for c in range(8)))
+
+    for n in (1000, 100000, 1000000):
+        start_time = time.time()
+        board = solve_min_conflicts(n, seed=42)
+        print(f"N={n}: found a placement in {time.time() - start_time:.2f} seconds, "
+              f"valid={is_valid(board)}, {board.itemsize * n / 1e6:.1f} MB")
@@ -0,0 +1,111 @@
+import time
+from multiprocessing import Pool, cpu_count
+
+from nqueens_bitmask import count_completions, count_n_queens, iter_solutions, prefix_masks
+
+
+def work_units(n, symmetric=True):
+    """
+    Split the N-Queens search into independent (prefix, weight) units.
+
+    Each unit fixes the queens of the first two rows. With symmetric=True only
+    the left half of the first row is searched and every count is doubled,
+    because mirroring a board left-to-right maps each solution with its first
+    queen in column c to one with it in column n - 1 - c. For odd n the
+    middle column of the first row is its own mirror image, so there the
+    second-row queen is restricted to the left half instead.
+
+    Args:
+        n (int): Board size.
+        symmetric (bool): Use the mirror symmetry to halve the work.
+
+    Returns:
+        list: (prefix, weight) pairs; the total count is
+              sum(weight * count_completions(n, prefix)).
+    """
+    if n == 1:
+        return [((0,), 1)]
+    units = []
+    first_row = range(n // 2) if symmetric else range(n)
+    weight = 2 if symmetric else 1
+    for first in first_row:
+        for second in range(n):
+            if prefix_masks(n, (first, second)) is not None:
+                units.append(((first, second), weight))
+    if symmetric and n % 2 == 1:
+        middle = n // 2
+        for second in range(middle):
+            if prefix_masks(n, (middle, second)) is not None:
+                units.append(((middle, second), 2))
+    return units
+
+
+def _count_unit(args):
+    n, prefix, weight = args
+    return weight * count_completions(n, prefix)
+
+
+def _solve_unit(args):
+    n, prefix, mirrored = args
+    solutions = list(iter_solutions(n, prefix))
+    if mirrored:
+        solutions += [tuple(n - 1 - col for col in solution) for solution in solutions]
+    return solutions
+
+
+def count_n_queens_parallel(n, processes=None, symmetric=True):
+    """
+    Count N-Queens solutions using board symmetry and a process pool.
+
+    The two-row prefixes from work_units() are independent, so they are
+    fanned out over the pool and their weighted counts summed. Symmetry
+    halves the work and the pool divides what is left by the core count.
+
+    Args:
+        n (int): Board size.
+        processes (int): Worker count, defaults to the number of CPUs.
+        symmetric (bool): Use the mirror symmetry.
+
+    Returns:
+        int: Number of distinct solutions.
+    """
+    if n < 1:
+        return 0
+    units = [(n, prefix, weight) for prefix, weight in work_units(n, symmetric)]
+    with Pool(processes or cpu_count()) as pool:
+        return sum(pool.imap_unordered(_count_unit, units))
+
+
+def iter_solutions_parallel(n, processes=None, symmetric=True):
+    """
+    Yield every N-Queens solution, computed across a process pool.
+
+    Solutions arrive one work unit at a time in no particular order; with
+    symmetric=True each unit's mirror images are added by the worker.
+
+    Yields:
+        tuple: board where board[row] is the column of the queen in that row.
+    """
+    if n < 1:
+        return
+    units = [(n, prefix, symmetric and weight == 2)
+             for prefix, weight in work_units(n, symmetric)]
+    with Pool(processes or cpu_count()) as pool:
+        for solutions in pool.imap_unordered(_solve_unit, units):
+            yield from solutions
+
+
+if __name__ == "__main__":
+    print("8-queens solutions:", sorted(iter_solutions_parallel(8))[:3], "...")
+
+    n = 13
+    start_time = time.time()
+    serial = count_n_queens(n)
+    serial_time = time.time() - start_time
+
+    start_time = time.time()
+    parallel = count_n_queens_parallel(n)
+    parallel_time = time.time() - start_time
+
+    print(f"N={n}: serial {serial} in {serial_time:.2f} seconds, "
+          f"symmetric + {cpu_count()} process(es) {parallel} in {parallel_time:.2f} seconds")
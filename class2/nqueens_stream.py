@@ -0,0 +1,121 @@
+import struct
+
+from nqueens_bitmask import format_board, iter_solutions
+
+# Solution file layout: 8-byte header (magic, board size, padding) followed by
+# one record of n bytes per solution, byte r being the column of the queen in
+# row r.
+MAGIC = b"NQS1"
+HEADER = struct.Struct("<4sH2x")
+
+
+def _check_size(n):
+    if n > 256:
+        raise ValueError("compact solutions store one byte per row, n must be <= 256")
+
+
+def iter_compact_solutions(n, prefix=()):
+    """
+    Yield N-Queens solutions as compact byte strings.
+
+    Each solution is n bytes, one column index per row, instead of the n
+    strings of n characters that solve_n_queens() builds. Solutions are
+    produced one at a time, so memory use does not depend on how many
+    solutions there are.
+
+    Args:
+        n (int): Board size, at most 256 so every column fits in a byte.
+        prefix (sequence): Optional fixed columns for the first rows.
+
+    Yields:
+        bytes: solution[row] is the column of the queen in that row.
+    """
+    # Not a generator itself, so a bad n raises here rather than on first next()
+    _check_size(n)
+    return _compact(n, prefix)
+
+
+def _compact(n, prefix):
+    for solution in iter_solutions(n, prefix):
+        yield bytes(solution)
+
+
+def write_solutions(path, n, solutions=None, buffer_size=1 << 16):
+    """
+    Stream solutions to a binary file.
+
+    Args:
+        path (str): Output file.
+        n (int): Board size.
+        solutions (iterable): Compact solutions to write; defaults to all
+                              solutions from iter_compact_solutions(n).
+        buffer_size (int): Bytes collected before each write.
+
+    Returns:
+        int: Number of solutions written.
+    """
+    _check_size(n)
+    if solutions is None:
+        solutions = iter_compact_solutions(n)
+    count = 0
+    buffer = bytearray()
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, n))
+        for solution in solutions:
+            buffer += solution
+            count += 1
+            if len(buffer) >= buffer_size:
+                f.write(buffer)
+                buffer.clear()
+        f.write(buffer)
+    return count
+
+
+def read_solutions(path, batch=4096):
+    """
+    Read back a file written by write_solutions(), one solution at a time.
+
+    Args:
+        path (str): Solution file.
+        batch (int): Solutions read from disk per read call.
+
+    Yields:
+        bytes: One compact solution per record.
+    """
+    with open(path, "rb") as f:
+        magic, n = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an N-Queens solution file")
+        if n == 0:
+            return
+        while True:
+            chunk = f.read(n * batch)
+            if not chunk:
+                break
+            if len(chunk) % n:
+                raise ValueError(f"{path} ends with a truncated solution")
+            for start in range(0, len(chunk), n):
+                yield chunk[start:start + n]
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+    import tracemalloc
+
+    for solution in iter_compact_solutions(4):
+        print(list(solution), format_board(solution))
+
+    n = 12
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f"queens{n}.bin")
+        tracemalloc.start()
+        start_time = time.time()
+        count = write_solutions(path, n)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"N={n}: wrote {count} solutions ({os.path.getsize(path)} bytes) "
+              f"in {time.time() - start_time:.2f} seconds, peak memory {peak / 1024:.1f} KiB")
+        print("first solution read back:", list(next(read_solutions(path))))
+        print("solutions read back:", sum(1 for _ in read_solutions(path)))
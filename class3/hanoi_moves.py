@@ -0,0 +1,143 @@
+import itertools
+
+
+def total_moves(n):
+    """Number of moves in the optimal solution for n disks: 2^n - 1."""
+    return (1 << n) - 1
+
+
+def _move(m, pegs):
+    """
+    Closed form for move number m (1-based) of the optimal n-disk solution.
+
+    The disk moved at step m is one more than the number of trailing zero
+    bits of m. Numbering the pegs 0, 1, 2, that disk goes from peg
+    (m & (m - 1)) % 3 to peg ((m | (m - 1)) + 1) % 3; for an odd number of
+    disks this carries the tower from peg 0 to peg 2, for an even number
+    from peg 0 to peg 1, so pegs 1 and 2 swap roles when n is even.
+    """
+    disk = (m & -m).bit_length()
+    source = (m & (m - 1)) % 3
+    target = ((m | (m - 1)) + 1) % 3
+    return disk, pegs[source], pegs[target]
+
+
+def _peg_order(n, left, middle, right):
+    # Map the 0/1/2 pegs of the formula onto the caller's names
+    return (left, middle, right) if n % 2 else (left, right, middle)
+
+
+def iter_moves(n, left='A', middle='B', right='C'):
+    """
+    Lazily yield the moves that carry n disks from left to right.
+
+    Same moves, in the same order, as tower_of_hanoi(n, left, middle, right)
+    in towerofhanoi.py, but without recursion or printing: each move is
+    computed from its step number with a few bit operations, so every move
+    costs O(1) and nothing is stored between moves. Works for any n up to 64
+    (2^64 - 1 moves); the caller decides how many to consume.
+
+    Args:
+        n (int): Number of disks, 1 is the smallest.
+        left: Name of the starting peg.
+        middle: Name of the spare peg.
+        right: Name of the destination peg.
+
+    Yields:
+        tuple: (disk, from_peg, to_peg) for each move.
+    """
+    if not 0 <= n <= 64:
+        raise ValueError("n must be between 0 and 64")
+    pegs = _peg_order(n, left, middle, right)
+    for m in range(1, total_moves(n) + 1):
+        yield _move(m, pegs)
+
+
+def move_at(n, k, left='A', middle='B', right='C'):
+    """
+    Return move number k (1-based) of the n-disk solution without generating
+    the moves before it.
+
+    Returns:
+        tuple: (disk, from_peg, to_peg), as yielded by iter_moves().
+    """
+    if not 1 <= k <= total_moves(n):
+        raise ValueError(f"k must be between 1 and {total_moves(n)}")
+    return _move(k, _peg_order(n, left, middle, right))
+
+
+def configuration_at(n, k, left='A', middle='B', right='C'):
+    """
+    Return where every disk is after the first k moves, in O(n).
+
+    Disk d moves at the steps whose lowest set bit is 2^(d - 1), so after k
+    moves it has moved (k + 2^(d - 1)) // 2^d times. It always cycles
+    through the pegs in the same direction: left -> right -> middle when
+    n - d is even, left -> middle -> right when n - d is odd.
+
+    Args:
+        n (int): Number of disks.
+        k (int): Moves made, 0 <= k <= 2^n - 1.
+
+    Returns:
+        tuple: config[d - 1] is the peg holding disk d.
+    """
+    if not 0 <= k <= total_moves(n):
+        raise ValueError(f"k must be between 0 and {total_moves(n)}")
+    pegs = (left, middle, right)
+    config = []
+    for disk in range(1, n + 1):
+        moves = (k + (1 << (disk - 1))) >> disk
+        step = 2 if (n - disk) % 2 == 0 else 1
+        config.append(pegs[(moves * step) % 3])
+    return tuple(config)
+
+
+def index_of(config, left='A', middle='B', right='C'):
+    """
+    Return how many moves of the optimal solution lead to config, in O(n).
+
+    The inverse of configuration_at(). Working from the largest disk down:
+    if it is still on the source peg the smaller disks are on their way to
+    the spare peg; if it is on the target peg its move (2^(d - 1) steps of
+    smaller disks plus itself) is done and the smaller disks are on their way
+    from the spare peg to the target.
+
+    Args:
+        config (sequence): config[d - 1] is the peg holding disk d.
+
+    Returns:
+        int: k such that configuration_at(len(config), k) == tuple(config).
+
+    Raises:
+        ValueError: If config never occurs in the optimal solution.
+    """
+    source, spare, target = left, middle, right
+    k = 0
+    for disk in range(len(config), 0, -1):
+        peg = config[disk - 1]
+        if peg == source:
+            spare, target = target, spare
+        elif peg == target:
+            k += 1 << (disk - 1)
+            source, spare = spare, source
+        else:
+            raise ValueError(f"disk {disk} on {peg!r} is not on the optimal path")
+    return k
+
+
+if __name__ == "__main__":
+    for disk, source, target in iter_moves(3, 'A', 'B', 'C'):
+        print(f"Move disk {disk} from {source} to {target}")
+
+    # First few moves of the 64-disk puzzle, without generating the rest
+    print(f"64 disks need {total_moves(64)} moves, the first five are:")
+    for move in itertools.islice(iter_moves(64), 5):
+        print(move)
+
+    # Random access into the 64-disk solution
+    k = 10 ** 18
+    print(f"move {k}:", move_at(64, k))
+    config = configuration_at(64, k)
+    print(f"pegs of disks 1-8 after {k} moves:", config[:8])
+    print("index of that configuration:", index_of(config))
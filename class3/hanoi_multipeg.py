@@ -0,0 +1,109 @@
+import time
+
+from hanoi_moves import iter_moves
+
+# Frame-Stewart tables shared by every call, extended on demand:
+# _moves_table[p][n] is the move count for n disks on p pegs and
+# _split_table[p][n] how many top disks to park first.
+_moves_table = {}
+_split_table = {}
+
+
+def _extend_tables(n, pegs):
+    """Fill the Frame-Stewart tables up to n disks for 3..pegs pegs."""
+    for p in range(3, pegs + 1):
+        moves = _moves_table.setdefault(p, [0, 1])
+        split = _split_table.setdefault(p, [0, 0])
+        for disks in range(len(moves), n + 1):
+            if p == 3:
+                moves.append(2 * moves[disks - 1] + 1)
+                split.append(disks - 1)
+                continue
+            fewer_pegs = _moves_table[p - 1]
+            # Park t disks using all pegs, move the other disks - t with one
+            # peg fewer, then bring the t disks back on top
+            best_t = 1
+            best = 2 * moves[1] + fewer_pegs[disks - 1]
+            for t in range(2, disks):
+                cost = 2 * moves[t] + fewer_pegs[disks - t]
+                if cost < best:
+                    best, best_t = cost, t
+            moves.append(best)
+            split.append(best_t)
+
+
+def min_moves(n, pegs=4):
+    """
+    Number of moves the Frame-Stewart algorithm needs for n disks.
+
+    This is the optimum for 3 and 4 pegs and the best known (conjectured
+    optimal) for more. Results are kept in module-level tables, so repeated
+    and larger queries only compute what is missing.
+
+    Args:
+        n (int): Number of disks.
+        pegs (int): Number of pegs, at least 3.
+
+    Returns:
+        int: Move count.
+    """
+    if pegs < 3:
+        raise ValueError("need at least 3 pegs")
+    _extend_tables(n, pegs)
+    return _moves_table[pegs][n]
+
+
+def _moves(n, offset, source, target, spares):
+    """Yield the moves for disks offset+1..offset+n from source to target."""
+    if n == 0:
+        return
+    if len(spares) == 1:
+        for disk, from_peg, to_peg in iter_moves(n, source, spares[0], target):
+            yield disk + offset, from_peg, to_peg
+        return
+    t = _split_table[len(spares) + 2][n]
+    park, others = spares[0], spares[1:]
+    # 1. Top t disks out of the way onto one spare peg, using every peg
+    yield from _moves(t, offset, source, park, others + (target,))
+    # 2. Remaining disks to the target without the occupied spare peg
+    yield from _moves(n - t, offset + t, source, target, others)
+    # 3. Top t disks back onto the target
+    yield from _moves(t, offset, park, target, others + (source,))
+
+
+def multipeg_moves(n, pegs=('A', 'B', 'C', 'D')):
+    """
+    Lazily yield the Frame-Stewart moves for n disks on any number of pegs.
+
+    The tower goes from pegs[0] to pegs[-1]. The split for each sub-tower is
+    read from the memoized table, and three-peg sub-towers are streamed with
+    iter_moves(), so moves are produced one at a time even when there are
+    far too many to store.
+
+    Args:
+        n (int): Number of disks, 1 is the smallest.
+        pegs (sequence): Peg names, at least three.
+
+    Yields:
+        tuple: (disk, from_peg, to_peg) for each move.
+    """
+    if len(pegs) < 3:
+        raise ValueError("need at least 3 pegs")
+    _extend_tables(n, len(pegs))
+    yield from _moves(n, 0, pegs[0], pegs[-1], tuple(pegs[1:-1]))
+
+
+if __name__ == "__main__":
+    for move in multipeg_moves(4, ('A', 'B', 'C', 'D')):
+        print("Move disk %d from %s to %s" % move)
+
+    for pegs in (3, 4, 5):
+        print(f"{pegs} pegs:", [min_moves(n, pegs) for n in range(1, 11)])
+
+    start_time = time.time()
+    print("300 disks, 4 pegs:", min_moves(300, 4), "moves")
+    print("300 disks, 5 pegs:", min_moves(300, 5), "moves")
+    print(f"tables built in {time.time() - start_time:.2f} seconds")
+
+    count = sum(1 for _ in multipeg_moves(100, ('A', 'B', 'C', 'D', 'E')))
+    print(f"streamed all {count} moves for 100 disks on 5 pegs")
@@ -0,0 +1,141 @@
+import logging
+
+from games import NestedListGame
+
+
+class AlphaBetaResult:
+    def __init__(self, alpha, beta, value, pruned, nodes):
+        self.alpha = alpha
+        self.beta = beta
+        self.value = value      # same as the `tree` global after alphabeta()
+        self.pruned = pruned
+        self.nodes = nodes
+
+    def __repr__(self):
+        return (f"AlphaBetaResult(value={self.value}, alpha={self.alpha}, beta={self.beta}, "
+                f"pruned={self.pruned}, nodes={self.nodes})")
+
+
+class _SearchState:
+    """Counters for one search call, so concurrent calls never share them."""
+
+    def __init__(self):
+        self.pruned = 0
+        self.nodes = 0
+
+
+class AlphaBetaEngine:
+    """
+    Re-entrant version of children()/alphabeta() from alphabetasearch.py.
+
+    It follows the same rules (MAX on even depths, MIN on odd depths, a MIN
+    node passes its alpha up and a MAX node its beta, one prune counted per
+    cutoff) and gives the same results, but:
+      - nothing is global: the pruned/node counters live in a per-call
+        state object and the settings on the engine never change during a
+        search, so one engine can run many searches at once from threads;
+      - the input tree is only read, never overwritten with backed-up
+        values, so the same tree can be searched again or shared;
+      - trees are walked through the game interface of games.py, so any
+        tree source works, not just nested lists.
+    """
+
+    def __init__(self, game=None, debug=False, logger=None):
+        """
+        Args:
+            game: Game interface, nested lists (alphabetasearch.py format) by default.
+            debug (bool): Log every step, indented by depth, like DEBUG=True.
+            logger (logging.Logger): Where debug output goes.
+        """
+        self.game = game if game is not None else NestedListGame()
+        self.debug = debug
+        self.logger = logger or logging.getLogger(__name__)
+
+    def search(self, tree, root_depth=0, alpha=float('-inf'), beta=float('inf')):
+        """
+        Run alpha-beta on tree.
+
+        Args:
+            tree: Root position.
+            root_depth (int): Depth of the root; even means MAX moves first.
+            alpha, beta: Initial window.
+
+        Returns:
+            AlphaBetaResult: final alpha/beta, the root value and counters.
+        """
+        state = _SearchState()
+        alpha, beta = self._visit(tree, root_depth, alpha, beta, state)
+        value = alpha if root_depth % 2 == 0 else beta
+        return AlphaBetaResult(alpha, beta, value, state.pruned, state.nodes)
+
+    def _log(self, depth, message):
+        # Callers check self.debug first, so messages are only formatted when logged
+        self.logger.info("%s%s", "  " * depth, message)
+
+    def _visit(self, branch, depth, alpha, beta, state):
+        game = self.game
+        debug = self.debug
+        state.nodes += 1
+        maximizing = depth % 2 == 0
+        if debug:
+            self._log(depth, f"Entering {'MAX' if maximizing else 'MIN'} node at depth {depth}, "
+                             f"α={alpha}, β={beta}")
+        for move, child in game.children(branch):
+            if not game.is_terminal(child):
+                nalpha, nbeta = self._visit(child, depth + 1, alpha, beta, state)
+                if maximizing:
+                    alpha = max(alpha, nbeta)
+                else:
+                    beta = min(beta, nalpha)
+            else:
+                state.nodes += 1
+                value = game.evaluate(child)
+                if debug:
+                    self._log(depth, f"Leaf {move} has value {value}")
+                if maximizing:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+            if alpha >= beta:
+                state.pruned += 1
+                if debug:
+                    self._log(depth, f"PRUNING! α={alpha} >= β={beta}")
+                break
+        if debug:
+            self._log(depth, f"Exiting node at depth {depth} with α={alpha}, β={beta}")
+        return alpha, beta
+
+
+def _search_in_process(tree):
+    # Module-level so a process pool can pickle it
+    return AlphaBetaEngine().search(tree)
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+
+    tree = [[[5, 1, 2], [8, -8, -9]], [[9, 4, 5], [-3, 4, 3]]]
+    engine = AlphaBetaEngine(debug=True)
+    print(engine.search(tree))
+    print("Tree is unchanged:", tree)
+
+    def random_tree(rng, depth, branching=3):
+        if depth == 0:
+            return rng.randint(-20, 20)
+        return [random_tree(rng, depth - 1, branching) for _ in range(branching)]
+
+    rng = random.Random(5)
+    trees = [random_tree(rng, 6) for _ in range(16)]
+    engine = AlphaBetaEngine()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        threaded = list(pool.map(engine.search, trees))
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        in_processes = list(pool.map(_search_in_process, trees))
+    serial = [engine.search(tree) for tree in trees]
+    print("Thread, process and serial results agree:",
+          [r.value for r in threaded] == [r.value for r in in_processes] == [r.value for r in serial])
+    print("Values:", [r.value for r in serial])
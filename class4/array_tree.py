@@ -0,0 +1,213 @@
+import numpy as np
+
+
+class SearchStats:
+    def __init__(self):
+        self.nodes = 0          # interior nodes entered
+        self.leaves = 0         # leaf values looked at
+        self.cutoffs = 0
+
+    def __repr__(self):
+        return f"SearchStats(nodes={self.nodes}, leaves={self.leaves}, cutoffs={self.cutoffs})"
+
+
+class ArrayTree:
+    """
+    A uniform game tree stored as one flat NumPy array of leaf values.
+
+    When every node on a level has the same number of children b there is
+    no need to store the tree shape: the node at level k, index i has its
+    children at level k + 1, indexes i*b .. i*b + b - 1, and the leaves sit
+    in order in one array. Interior levels are only built when needed, by
+    reshaping the level below to (-1, b) and taking max or min along the
+    rows, so a 16 million leaf tree costs 64 MB as int32 instead of
+    gigabytes of lists.
+
+    Like alphabetasearch.py, level 0 (the root) is MAX and levels alternate.
+    A position for the games.py interface is (level, index).
+    """
+
+    def __init__(self, leaves, branching):
+        """
+        Args:
+            leaves (array-like): Leaf values, left to right.
+            branching (int or tuple): Children per interior node, or one
+                                      count per level (the array shape of
+                                      the nested tree).
+        """
+        self.leaves = np.ascontiguousarray(leaves).ravel()
+        if isinstance(branching, int):
+            if branching < 2 and len(self.leaves) != 1:
+                raise ValueError(f"branching must be at least 2, got {branching}")
+            shape = []
+            while np.prod(shape, dtype=np.int64) < len(self.leaves):
+                shape.append(branching)
+            branching = shape
+        self.shape = tuple(branching)
+        self.depth = len(self.shape)
+        if np.prod(self.shape, dtype=np.int64) != len(self.leaves):
+            raise ValueError(f"{len(self.leaves)} leaves do not fit branching {self.shape}")
+
+    @classmethod
+    def from_nested(cls, tree):
+        """Build from a uniform nested-list tree like the one in alphabetasearch.py."""
+        leaves = np.asarray(tree)
+        if leaves.dtype == object:
+            raise ValueError("tree is not uniform")
+        return cls(leaves, leaves.shape)
+
+    @classmethod
+    def from_function(cls, branching, depth, evaluate):
+        """
+        Build by evaluating all leaves in one call.
+
+        Args:
+            evaluate (callable): Takes an array of leaf indexes and returns
+                                 their values; written in base branching,
+                                 digit k of an index is the move at ply k.
+        """
+        return cls(evaluate(np.arange(branching ** depth, dtype=np.int64)), branching)
+
+    @classmethod
+    def random(cls, branching, depth, low=-100, high=100, seed=None, dtype=np.int32):
+        """Tree with uniformly random integer leaves in [low, high]."""
+        rng = np.random.default_rng(seed)
+        return cls(rng.integers(low, high + 1, size=branching ** depth, dtype=dtype), branching)
+
+    def to_nested(self):
+        """The tree as nested lists, the format of alphabetasearch.py."""
+        if self.depth == 0:
+            return self.leaves[0].item()
+        return self.leaves.reshape(self.shape).tolist()
+
+    def nbytes(self):
+        return self.leaves.nbytes
+
+    # Vectorized minimax
+
+    def levels(self):
+        """
+        Minimax value of every node, level by level.
+
+        Returns:
+            list: levels[k] is an array with the values of the nodes at level k.
+        """
+        levels = [self.leaves]
+        values = self.leaves
+        for level in reversed(range(self.depth)):
+            rows = values.reshape(-1, self.shape[level])
+            values = rows.max(axis=1) if level % 2 == 0 else rows.min(axis=1)
+            levels.append(values)
+        levels.reverse()
+        return levels
+
+    def minimax(self):
+        """Root value by full vectorized minimax: one reduction per level."""
+        values = self.leaves
+        for level in reversed(range(self.depth)):
+            rows = values.reshape(-1, self.shape[level])
+            values = rows.max(axis=1) if level % 2 == 0 else rows.min(axis=1)
+        return values[0].item()
+
+    # Alpha-beta over indexes
+
+    def alpha_beta(self, alpha=float('-inf'), beta=float('inf'), stats=None):
+        """
+        Fail-soft alpha-beta that walks node indexes instead of objects.
+
+        Nodes just above the leaves are finished with NumPy: the leaves of
+        such a node are one contiguous slice, and the first one that causes
+        a cutoff is found with a single vectorized comparison.
+
+        Returns:
+            The root value; stats, if given, is filled in with counters.
+        """
+        if stats is None:
+            stats = SearchStats()
+        if self.depth == 0:
+            stats.leaves += 1
+            return self.leaves[0].item()
+        return self._alpha_beta(0, 0, alpha, beta, stats)
+
+    def _alpha_beta(self, level, index, alpha, beta, stats):
+        b = self.shape[level]
+        maximizing = level % 2 == 0
+        stats.nodes += 1
+        first = index * b
+        if level == self.depth - 1:
+            values = self.leaves[first:first + b]
+            cut = np.flatnonzero(values >= beta if maximizing else values <= alpha)
+            if len(cut):
+                values = values[:cut[0] + 1]
+                stats.cutoffs += 1
+            stats.leaves += len(values)
+            return (values.max() if maximizing else values.min()).item()
+
+        best = float('-inf') if maximizing else float('inf')
+        for child in range(first, first + b):
+            value = self._alpha_beta(level + 1, child, alpha, beta, stats)
+            if maximizing:
+                best = max(best, value)
+                alpha = max(alpha, value)
+            else:
+                best = min(best, value)
+                beta = min(beta, value)
+            if beta <= alpha:
+                stats.cutoffs += 1
+                break
+        return best
+
+    # games.py interface, so the other class4 searches can walk the tree
+
+    def root(self):
+        return (0, 0)
+
+    def children(self, position):
+        level, index = position
+        if level == self.depth:
+            return []
+        b = self.shape[level]
+        return [(move, (level + 1, index * b + move)) for move in range(b)]
+
+    def is_terminal(self, position):
+        return position[0] == self.depth
+
+    def evaluate(self, position):
+        # Interior nodes (depth-limited search) get their leftmost leaf as a cheap estimate
+        level, index = position
+        return self.leaves[index * int(np.prod(self.shape[level:]))].item()
+
+    def key(self, position):
+        return position
+
+
+if __name__ == "__main__":
+    import time
+
+    from alphabeta_engine import AlphaBetaEngine
+
+    # The tree from alphabetasearch.py
+    tree = ArrayTree.from_nested([[[5, 1, 2], [8, -8, -9]], [[9, 4, 5], [-3, 4, 3]]])
+    stats = SearchStats()
+    print("Minimax:", tree.minimax(), " alpha-beta:", tree.alpha_beta(stats=stats), stats)
+    print("Level values:", [level.tolist() for level in tree.levels()])
+
+    tree = ArrayTree.random(branching=4, depth=12, seed=1)
+    print(f"\nRandom tree: {len(tree.leaves):,} leaves in {tree.nbytes() / 2**20:.0f} MB")
+    start_time = time.perf_counter()
+    value = tree.minimax()
+    print(f"Vectorized minimax: {value} in {time.perf_counter() - start_time:.3f} seconds")
+    stats = SearchStats()
+    start_time = time.perf_counter()
+    value = tree.alpha_beta(stats=stats)
+    print(f"Index alpha-beta:   {value} in {time.perf_counter() - start_time:.3f} seconds, {stats}")
+
+    # Leaves computed in one batched call: a smooth function of the path plus noise
+    noise = np.random.default_rng(2).normal(0, 5, size=8 ** 7)
+    tree = ArrayTree.from_function(8, 7, lambda i: np.round(50 * np.sin(i / 8 ** 5) + noise))
+    print(f"\nEvaluated {len(tree.leaves):,} leaves in one call; minimax {tree.minimax()}, "
+          f"alpha-beta {tree.alpha_beta()}")
+
+    small = ArrayTree.random(branching=3, depth=6, seed=3)
+    print("AlphaBetaEngine through the game interface agrees:",
+          AlphaBetaEngine(small).search(small.root()).value == small.minimax())
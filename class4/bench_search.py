@@ -0,0 +1,138 @@
+"""
+Compare the alpha-beta search variants on the same trees.
+
+Runs the textbook max/min alpha-beta (alpha_beta_tt() from transposition.py,
+with and without a table) as the baseline, then the negamax, PVS and MTD(f)
+variants of search_variants.py, over a workload of seeded procedural trees
+or tic-tac-toe. Checks that they all find the same values, and reports
+nodes visited, cutoffs and time for each.
+
+Usage:
+    python bench_search.py --branching 6 --depth 7 --trees 5
+    python bench_search.py --workload tictactoe --output run.json
+"""
+import argparse
+import json
+import sys
+import time
+
+from games import TicTacToe
+from procedural_tree import ProceduralTree
+from search_variants import SearchCounters, mtdf, negamax, principal_variation_search
+from transposition import TranspositionTable, alpha_beta_tt
+
+
+def _alpha_beta(game, root, depth, table_size, counters):
+    return alpha_beta_tt(root, depth, float('-inf'), float('inf'), True, None, game, counters)
+
+
+def _alpha_beta_tt(game, root, depth, table_size, counters):
+    return alpha_beta_tt(root, depth, float('-inf'), float('inf'), True,
+                         TranspositionTable(table_size), game, counters)
+
+
+def _negamax(game, root, depth, table_size, counters):
+    return negamax(game, root, depth, counters=counters)
+
+
+def _negamax_tt(game, root, depth, table_size, counters):
+    return negamax(game, root, depth, table=TranspositionTable(table_size), counters=counters)
+
+
+def _pvs(game, root, depth, table_size, counters):
+    return principal_variation_search(game, root, depth, table=TranspositionTable(table_size),
+                                      counters=counters)
+
+
+def _mtdf(game, root, depth, table_size, counters):
+    return mtdf(game, root, depth, table=TranspositionTable(table_size), counters=counters)
+
+
+VARIANTS = {
+    "alpha-beta": _alpha_beta,
+    "alpha-beta+tt": _alpha_beta_tt,
+    "negamax": _negamax,
+    "negamax+tt": _negamax_tt,
+    "pvs+tt": _pvs,
+    "mtdf+tt": _mtdf,
+}
+
+
+def procedural_workload(branching, depth, trees, seed=0):
+    """(game, root, depth) for trees seeded procedural trees."""
+    result = []
+    for i in range(trees):
+        tree = ProceduralTree(seed=seed + i, branching=branching, depth=depth)
+        result.append((tree, tree.root(), depth))
+    return result
+
+
+def tictactoe_workload():
+    game = TicTacToe()
+    return [(game, game.initial(), 9)]
+
+
+def run(workload, variants, table_size=1 << 16):
+    """
+    Run every variant on every tree of workload.
+
+    Returns:
+        list: One dict per variant with summed nodes, cutoffs and seconds,
+              and the values it found.
+    """
+    results = []
+    for name in variants:
+        counters = SearchCounters()
+        values = []
+        start_time = time.perf_counter()
+        for game, root, depth in workload:
+            values.append(VARIANTS[name](game, root, depth, table_size, counters))
+        results.append({
+            "variant": name,
+            "nodes": counters.nodes,
+            "cutoffs": counters.cutoffs,
+            "researches": counters.researches,
+            "passes": counters.passes,
+            "seconds": time.perf_counter() - start_time,
+            "values": values,
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workload", choices=["procedural", "tictactoe"], default="procedural")
+    parser.add_argument("--branching", type=int, default=6)
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--trees", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--table-size", type=int, default=1 << 16)
+    parser.add_argument("--variants", nargs="+", choices=list(VARIANTS), default=list(VARIANTS))
+    parser.add_argument("--output", help="also write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    if args.workload == "tictactoe":
+        workload = tictactoe_workload()
+    else:
+        workload = procedural_workload(args.branching, args.depth, args.trees, args.seed)
+    results = run(workload, args.variants, args.table_size)
+
+    baseline = results[0]
+    print(f"{'variant':14} {'nodes':>10} {'vs first':>8} {'cutoffs':>9} {'seconds':>8}")
+    for result in results:
+        print(f"{result['variant']:14} {result['nodes']:10,} "
+              f"{result['nodes'] / baseline['nodes']:8.2f} {result['cutoffs']:9,} "
+              f"{result['seconds']:8.3f}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+
+    if any(result["values"] != baseline["values"] for result in results):
+        print("Variants disagree on values:", {r["variant"]: r["values"] for r in results},
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+Game interfaces for the class4 search modules.
+
+A game object tells the search how to walk positions:
+  - children(position)    -> list of (move, child position)
+  - is_terminal(position) -> True if the game is over at position
+  - evaluate(position)    -> score from the MAX player's point of view
+  - key(position)         -> hashable key identifying the position, used
+                             by the transposition table
+"""
+import random
+
+
+class Node:
+    def __init__(self, name, children=None, value=None):
+        self.name = name
+        self.children = children if children is not None else []
+        self.value = value
+
+
+class NodeGame:
+    """The Node trees of alphabetasearch_gemini.py as a game; moves are child names."""
+
+    def children(self, node):
+        return [(child.name, child) for child in node.children]
+
+    def is_terminal(self, node):
+        return node.value is not None
+
+    def evaluate(self, node):
+        return node.value
+
+    def key(self, node):
+        return node.name
+
+
+class NestedListGame:
+    """
+    The nested-list trees of alphabetasearch.py as a game: a position is a
+    list of children or a leaf number, and moves are child indexes.
+    """
+
+    def children(self, branch):
+        return list(enumerate(branch)) if isinstance(branch, list) else []
+
+    def is_terminal(self, branch):
+        return not isinstance(branch, list)
+
+    def evaluate(self, branch):
+        return branch
+
+    def key(self, branch):
+        return id(branch)
+
+
+class ZobristHasher:
+    """
+    Zobrist hashing for board games.
+
+    Every (square, piece) pair gets a random 64-bit number and the position
+    key is the XOR of the numbers of all occupied squares, plus one more for
+    the side to move. Making or unmaking a move only XORs a couple of
+    numbers, so the key of a child is computed in O(1) from its parent's.
+    """
+
+    def __init__(self, squares, pieces, seed=2024):
+        rng = random.Random(seed)
+        self.table = [{piece: rng.getrandbits(64) for piece in pieces} for _ in range(squares)]
+        self.side = rng.getrandbits(64)
+
+    def hash(self, board, side_to_move_is_second=False, empty=' '):
+        key = self.side if side_to_move_is_second else 0
+        for square, piece in enumerate(board):
+            if piece != empty:
+                key ^= self.table[square][piece]
+        return key
+
+    def place(self, key, square, piece):
+        """Key after putting piece on square and passing the move to the other side."""
+        return key ^ self.table[square][piece] ^ self.side
+
+
+class TicTacToe:
+    """
+    Tic-tac-toe with the board layout of class6/tictactoe.py: a list of 10
+    cells where index 0 is unused and 1..9 are the squares.
+
+    A position is (board tuple, mark to move, Zobrist key). X is the MAX
+    player: a win for X scores +1, a win for O -1 and a draw 0.
+    """
+
+    LINES = ((1, 2, 3), (4, 5, 6), (7, 8, 9), (1, 4, 7),
+             (2, 5, 8), (3, 6, 9), (1, 5, 9), (3, 5, 7))
+
+    def __init__(self):
+        self.zobrist = ZobristHasher(10, ('X', 'O'))
+
+    def initial(self):
+        board = (' ',) * 10
+        return board, 'X', self.zobrist.hash(board)
+
+    def winner(self, board):
+        for a, b, c in self.LINES:
+            if board[a] != ' ' and board[a] == board[b] == board[c]:
+                return board[a]
+        return None
+
+    def children(self, position):
+        board, mark, key = position
+        if self.winner(board):
+            return []
+        other = 'O' if mark == 'X' else 'X'
+        result = []
+        for square in range(1, 10):
+            if board[square] == ' ':
+                child = board[:square] + (mark,) + board[square + 1:]
+                result.append((square, (child, other, self.zobrist.place(key, square, mark))))
+        return result
+
+    def is_terminal(self, position):
+        board = position[0]
+        return self.winner(board) is not None or ' ' not in board[1:]
+
+    def evaluate(self, position):
+        winner = self.winner(position[0])
+        return 1 if winner == 'X' else -1 if winner == 'O' else 0
+
+    def key(self, position):
+        return position[2]
@@ -0,0 +1,187 @@
+import time
+
+from games import TicTacToe
+from transposition import TranspositionTable, bound_for, probe_cutoff
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the wall-clock budget is used up."""
+
+
+class SearchResult:
+    def __init__(self, best_move, value, depth, nodes, elapsed, timed_out):
+        self.best_move = best_move
+        self.value = value
+        self.depth = depth          # deepest fully completed iteration
+        self.nodes = nodes
+        self.elapsed = elapsed
+        self.timed_out = timed_out
+
+    def __repr__(self):
+        return (f"SearchResult(best_move={self.best_move!r}, value={self.value}, "
+                f"depth={self.depth}, nodes={self.nodes}, elapsed={self.elapsed:.3f}s, "
+                f"timed_out={self.timed_out})")
+
+
+class IterativeDeepeningSearch:
+    """
+    Iterative-deepening alpha-beta with move ordering and a time budget.
+
+    The search is run to depth 1, 2, 3, ... and each iteration feeds the
+    next one:
+      - the transposition table remembers the best move of every node, and
+        that principal-variation move is tried first;
+      - killer moves (the last two moves that caused a cutoff at the same
+        ply) are tried next, then the remaining moves by history score
+        (how often and how deep a move has caused cutoffs anywhere);
+      - each iteration after the first starts with a narrow aspiration
+        window around the previous value and only re-searches with the full
+        window if the value falls outside it.
+
+    With a wall-clock budget the search stops as soon as time runs out and
+    returns the best move of the last completed iteration.
+    """
+
+    def __init__(self, game, table=None, time_budget=None, aspiration=1.0,
+                 check_every=256):
+        """
+        Args:
+            game: Game interface, see games.py.
+            table (TranspositionTable): Table to use, a new one by default.
+            time_budget (float): Seconds allowed per search, None for no limit.
+            aspiration (float): Half-width of the aspiration window, 0 to disable.
+            check_every (int): Nodes between clock checks.
+        """
+        self.game = game
+        self.table = table if table is not None else TranspositionTable()
+        self.time_budget = time_budget
+        self.aspiration = aspiration
+        self.check_every = check_every
+        self.killers = {}
+        self.history = {}
+        self.nodes = 0
+        self.deadline = None
+
+    def search(self, root, max_depth, maximizing_player=True):
+        """
+        Search root to at most max_depth plies.
+
+        Returns:
+            SearchResult: best move and value of the deepest completed iteration.
+        """
+        start = time.perf_counter()
+        self.deadline = None if self.time_budget is None else start + self.time_budget
+        self.nodes = 0
+        self.killers = {}
+        self.table.new_search()
+
+        children = self.game.children(root)
+        best_move = children[0][0] if children else None
+        value = self.game.evaluate(root) if not children else None
+        completed = 0
+        timed_out = False
+        for depth in range(1, max_depth + 1):
+            try:
+                value, best_move = self._iteration(root, depth, maximizing_player, value)
+            except SearchTimeout:
+                timed_out = True
+                break
+            completed = depth
+        return SearchResult(best_move, value, completed, self.nodes,
+                            time.perf_counter() - start, timed_out)
+
+    def _iteration(self, root, depth, maximizing_player, previous):
+        """One iteration, with an aspiration window around the previous value."""
+        inf = float('inf')
+        if self.aspiration and previous is not None and abs(previous) != inf:
+            alpha, beta = previous - self.aspiration, previous + self.aspiration
+            value, move = self._root(root, depth, alpha, beta, maximizing_player)
+            if alpha < value < beta:
+                return value, move
+        return self._root(root, depth, -inf, inf, maximizing_player)
+
+    def _root(self, root, depth, alpha, beta, maximizing_player):
+        value = self._alpha_beta(root, depth, 0, alpha, beta, maximizing_player)
+        entry = self.table.probe((self.game.key(root), maximizing_player))
+        return value, entry[4] if entry is not None else None
+
+    def _order(self, children, ply, tt_move):
+        killers = self.killers.get(ply, ())
+        history = self.history
+
+        def priority(item):
+            move = item[0]
+            if move == tt_move:
+                return (0, 0)
+            if move in killers:
+                return (1, killers.index(move))
+            return (2, -history.get(move, 0))
+
+        children.sort(key=priority)
+        return children
+
+    def _record_cutoff(self, move, ply, depth):
+        killers = self.killers.setdefault(ply, [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+        self.history[move] = self.history.get(move, 0) + depth * depth
+
+    def _alpha_beta(self, node, depth, ply, alpha, beta, maximizing_player):
+        self.nodes += 1
+        if (self.deadline is not None and self.nodes % self.check_every == 0
+                and time.perf_counter() > self.deadline):
+            raise SearchTimeout()
+        game = self.game
+        if depth == 0 or game.is_terminal(node):
+            return game.evaluate(node)
+
+        key = (game.key(node), maximizing_player)
+        entry = self.table.probe(key)
+        # The root is always searched so a best move gets stored for it
+        if ply > 0:
+            value, alpha, beta = probe_cutoff(entry, depth, alpha, beta)
+            if value is not None:
+                return value
+        tt_move = entry[4] if entry is not None else None
+        alpha_orig, beta_orig = alpha, beta
+
+        best_move = None
+        best = float('-inf') if maximizing_player else float('inf')
+        for move, child in self._order(game.children(node), ply, tt_move):
+            value = self._alpha_beta(child, depth - 1, ply + 1, alpha, beta,
+                                     not maximizing_player)
+            if maximizing_player:
+                if value > best:
+                    best, best_move = value, move
+                alpha = max(alpha, value)
+            else:
+                if value < best:
+                    best, best_move = value, move
+                beta = min(beta, value)
+            if beta <= alpha:
+                self._record_cutoff(move, ply, depth)
+                break
+
+        self.table.store(key, depth, best, bound_for(best, alpha_orig, beta_orig), best_move)
+        return best
+
+
+def iterative_deepening(game, root, max_depth, time_budget=None, maximizing_player=True,
+                        table=None):
+    """Convenience wrapper: run one IterativeDeepeningSearch and return its SearchResult."""
+    searcher = IterativeDeepeningSearch(game, table=table, time_budget=time_budget)
+    return searcher.search(root, max_depth, maximizing_player)
+
+
+if __name__ == "__main__":
+    game = TicTacToe()
+    root = game.initial()
+    print("Full search:     ", iterative_deepening(game, root, 9))
+    print("2 ms time budget:", iterative_deepening(game, root, 9, time_budget=0.002))
+
+    # X in a corner, O in the centre: what should X play?
+    board, _, _ = root
+    board = board[:1] + ('X',) + board[2:5] + ('O',) + board[6:]
+    position = (board, 'X', game.zobrist.hash(board))
+    print("Reply search:    ", iterative_deepening(game, position, 7))
@@ -0,0 +1,166 @@
+import time
+from multiprocessing import Pool, Value, cpu_count
+
+from search_variants import NegamaxSearch, SearchCounters
+from transposition import TranspositionTable
+
+# Per-worker state, set up by _init_worker()
+_worker_game = None
+_worker_table = None
+_worker_alpha = None
+_worker_pvs = False
+
+
+def _init_worker(game, shared_alpha, table_size, pvs):
+    """Pool initializer: the game, the shared root bound and a table kept for the whole search."""
+    global _worker_game, _worker_table, _worker_alpha, _worker_pvs
+    _worker_game = game
+    _worker_table = TranspositionTable(table_size)
+    _worker_alpha = shared_alpha
+    _worker_pvs = pvs
+
+
+def _search_subtree(task):
+    """
+    Worker task: test one root move with a null window at the best root
+    value found so far, re-search it only if it beats that value, then raise
+    the shared alpha if this move is better.
+    """
+    move, child, depth, child_maximizing = task
+    searcher = NegamaxSearch(_worker_game, _worker_table, _worker_pvs)
+    alpha = _worker_alpha.value
+    # Negamax: the child's window is (-beta, -alpha) of the root's
+    value = -searcher.search(child, depth, -alpha - 1, -alpha, child_maximizing)
+    if value > alpha:
+        # Fail high: value is only a lower bound, find the real one
+        searcher.counters.researches += 1
+        value = -searcher.search(child, depth, float('-inf'), -value, child_maximizing)
+    with _worker_alpha.get_lock():
+        if value > _worker_alpha.value:
+            _worker_alpha.value = value
+    return move, value, alpha, searcher.counters.nodes, searcher.counters.cutoffs
+
+
+class ParallelResult:
+    def __init__(self, best_move, value, nodes, cutoffs, elapsed, processes):
+        self.best_move = best_move
+        self.value = value
+        self.nodes = nodes
+        self.cutoffs = cutoffs
+        self.elapsed = elapsed
+        self.processes = processes
+
+    def __repr__(self):
+        return (f"ParallelResult(best_move={self.best_move!r}, value={self.value}, "
+                f"nodes={self.nodes}, cutoffs={self.cutoffs}, elapsed={self.elapsed:.3f}s, "
+                f"processes={self.processes})")
+
+
+def parallel_search(game, root, depth, maximizing_player=True, processes=None,
+                    table_size=1 << 16, pvs=False):
+    """
+    Root-splitting parallel alpha-beta (Young Brothers Wait at the root).
+
+    The first root move is searched alone in this process to get a good
+    bound, as in the serial search. The remaining moves are then handed to a
+    process pool one at a time. All workers share the best root value found
+    so far in one shared-memory double: a task reads it as its alpha when it
+    starts and first runs a null-window search (alpha, alpha + 1), so moves
+    that cannot beat an already finished sibling are refuted cheaply. Only a
+    move that fails high is re-searched with the window (value, +inf), and
+    the task then raises the shared alpha under a lock if the move is better.
+
+    Transposition entries are shared where it is cheap: each worker keeps
+    one table for every subtree it searches, but tables are not shared
+    between processes (locking a shared table on every node would cost
+    more than the entries save).
+
+    Args:
+        game: Game interface, see games.py; game and positions must pickle.
+        processes (int): Worker count, defaults to the number of CPUs.
+        table_size (int): Slots in each process's transposition table.
+        pvs (bool): Use PVS instead of plain alpha-beta inside each subtree.
+
+    Returns:
+        ParallelResult: best root move and value from MAX's point of view, and
+                        nodes and cutoffs summed over all processes.
+    """
+    start = time.perf_counter()
+    processes = processes or cpu_count()
+    sign = 1 if maximizing_player else -1
+    children = game.children(root)
+    if depth == 0 or not children:
+        return ParallelResult(None, game.evaluate(root), 1, 0,
+                              time.perf_counter() - start, processes)
+
+    # Eldest brother first, serially
+    counters = SearchCounters()
+    searcher = NegamaxSearch(game, TranspositionTable(table_size), pvs)
+    searcher.counters = counters
+    best_move, first = children[0]
+    best = -searcher.search(first, depth - 1, float('-inf'), float('inf'), not maximizing_player)
+    nodes, cutoffs = counters.nodes + 1, counters.cutoffs
+
+    shared_alpha = Value('d', best)
+    tasks = [(move, child, depth - 1, not maximizing_player) for move, child in children[1:]]
+    with Pool(processes, initializer=_init_worker,
+              initargs=(game, shared_alpha, table_size, pvs)) as pool:
+        for move, value, alpha, task_nodes, task_cutoffs in pool.imap_unordered(_search_subtree, tasks):
+            nodes += task_nodes
+            cutoffs += task_cutoffs
+            # A value at or below the task's alpha is only an upper bound
+            if value > alpha and value > best:
+                best, best_move = value, move
+    return ParallelResult(best_move, sign * best, nodes, cutoffs,
+                          time.perf_counter() - start, processes)
+
+
+def compare_with_serial(game, root, depth, maximizing_player=True, processes=None,
+                        table_size=1 << 16, pvs=False):
+    """
+    Run the serial negamax search and parallel_search() on the same position.
+
+    Returns:
+        dict: both values, node counts and times, the speedup (serial time /
+              parallel time) and the search overhead (extra nodes the
+              parallel search visited, as a fraction of the serial count).
+    """
+    counters = SearchCounters()
+    searcher = NegamaxSearch(game, TranspositionTable(table_size), pvs)
+    searcher.counters = counters
+    start = time.perf_counter()
+    serial_value = searcher.search(root, depth, float('-inf'), float('inf'), maximizing_player)
+    serial_elapsed = time.perf_counter() - start
+    if not maximizing_player:
+        serial_value = -serial_value
+
+    parallel = parallel_search(game, root, depth, maximizing_player, processes, table_size, pvs)
+    return {
+        "serial_value": serial_value,
+        "parallel_value": parallel.value,
+        "serial_nodes": counters.nodes,
+        "parallel_nodes": parallel.nodes,
+        "serial_seconds": serial_elapsed,
+        "parallel_seconds": parallel.elapsed,
+        "processes": parallel.processes,
+        "speedup": serial_elapsed / parallel.elapsed,
+        "overhead": parallel.nodes / counters.nodes - 1,
+    }
+
+
+if __name__ == "__main__":
+    from games import TicTacToe
+    from procedural_tree import ProceduralTree
+
+    tree = ProceduralTree(seed=11, branching=12, depth=6)
+    game = TicTacToe()
+    workloads = [("procedural 12^6", tree, tree.root(), tree.depth),
+                 ("tic-tac-toe", game, game.initial(), 9)]
+    print(f"{cpu_count()} CPUs available")
+    for name, game, root, depth in workloads:
+        for processes in (1, 2, 4):
+            report = compare_with_serial(game, root, depth, processes=processes)
+            assert report["serial_value"] == report["parallel_value"]
+            print(f"{name:16} {processes} processes: value {report['parallel_value']}, "
+                  f"speedup {report['speedup']:.2f}x, overhead {report['overhead']:+.1%} "
+                  f"({report['serial_nodes']:,} -> {report['parallel_nodes']:,} nodes)")
@@ -0,0 +1,153 @@
+MASK64 = (1 << 64) - 1
+
+
+def _mix(x):
+    """splitmix64 finaliser: a fast, well-spread 64-bit hash of x."""
+    x = (x + 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+
+class ProceduralTree:
+    """
+    A game tree that is never stored: nodes are generated on demand.
+
+    A node is identified by a 64-bit hash of the tree seed and the path of
+    child indexes leading to it; a child's hash is derived from its parent's,
+    so a position is just (depth, hash) and costs the same to create at any
+    depth. Leaf values (and the heuristic value of interior nodes cut off by
+    a depth limit) are derived from the hash too, so the same seed always
+    gives the same tree.
+
+    Implements the game interface of games.py, so alpha_beta_tt(),
+    IterativeDeepeningSearch and AlphaBetaEngine search it directly and only
+    the nodes they visit are ever created. A tree with branching 32 and
+    depth 6 has over 10^9 leaves but costs nothing to set up.
+    """
+
+    def __init__(self, seed=0, branching=4, depth=8, value_range=(-100, 100)):
+        """
+        Args:
+            seed (int): Tree seed.
+            branching (int or tuple): Children per interior node, or a
+                                      (min, max) range chosen per node.
+            depth (int): Depth of the leaves (root is depth 0).
+            value_range (tuple): Inclusive (low, high) range of node values.
+        """
+        self.seed = seed
+        self.branching = branching
+        self.depth = depth
+        self.low, self.high = value_range
+
+    def root(self):
+        return (0, _mix(self.seed))
+
+    def branching_at(self, position):
+        if isinstance(self.branching, int):
+            return self.branching
+        low, high = self.branching
+        return low + position[1] % (high - low + 1)
+
+    def child(self, position, index):
+        depth, h = position
+        return (depth + 1, _mix(h ^ _mix(index + 1)))
+
+    def children(self, position):
+        if position[0] >= self.depth:
+            return []
+        return [(i, self.child(position, i)) for i in range(self.branching_at(position))]
+
+    def is_terminal(self, position):
+        return position[0] >= self.depth
+
+    def evaluate(self, position):
+        # Use the top bits: the low bits also decide the branching factor
+        return self.low + (position[1] >> 16) % (self.high - self.low + 1)
+
+    def key(self, position):
+        return position
+
+    def leaf_count(self):
+        """Number of leaves when the branching factor is fixed."""
+        return self.branching ** self.depth
+
+    def node(self, position=None, name="root"):
+        """Return a LazyNode view of position, for alpha_beta_pruning()."""
+        return LazyNode(self, position or self.root(), name)
+
+
+class LazyNode:
+    """
+    Node-compatible view of a ProceduralTree position.
+
+    Has the name/children/value attributes that alphabetasearch_gemini.py's
+    Node has, but children are only created when .children is read, so
+    alpha_beta_pruning() can search a procedural tree unchanged.
+    """
+
+    def __init__(self, tree, position, name):
+        self.tree = tree
+        self.position = position
+        self.name = name
+
+    @property
+    def children(self):
+        return [LazyNode(self.tree, child, f"{self.name}.{i}")
+                for i, child in self.tree.children(self.position)]
+
+    @property
+    def value(self):
+        if self.tree.is_terminal(self.position):
+            return self.tree.evaluate(self.position)
+        return None
+
+
+class CountingTree:
+    """Wraps a tree source and counts the nodes generated and leaves evaluated."""
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.generated = 0
+        self.evaluated = 0
+
+    def children(self, position):
+        children = self.tree.children(position)
+        self.generated += len(children)
+        return children
+
+    def evaluate(self, position):
+        self.evaluated += 1
+        return self.tree.evaluate(position)
+
+    def __getattr__(self, name):
+        return getattr(self.tree, name)
+
+
+if __name__ == "__main__":
+    import time
+
+    from alphabeta_engine import AlphaBetaEngine
+    from iterative_deepening import IterativeDeepeningSearch
+    from transposition import TranspositionTable, alpha_beta_tt
+
+    tree = ProceduralTree(seed=7, branching=32, depth=6)
+    print(f"Tree with {tree.leaf_count():,} leaves")
+    counting = CountingTree(tree)
+    result = IterativeDeepeningSearch(counting, time_budget=2.0).search(tree.root(), tree.depth)
+    print(f"Iterative deepening, 2 s budget: {result}")
+    print(f"  {counting.generated:,} nodes generated, {counting.evaluated:,} evaluated")
+
+    tree = ProceduralTree(seed=7, branching=(2, 6), depth=9)
+    counting = CountingTree(tree)
+    start_time = time.time()
+    result = AlphaBetaEngine(counting).search(tree.root())
+    print(f"AlphaBetaEngine on a 2-6 way tree of depth 9: value {result.value}, "
+          f"{counting.generated:,} nodes generated, {time.time() - start_time:.2f} seconds")
+    value = alpha_beta_tt(tree.root(), tree.depth, float('-inf'), float('inf'), True,
+                          TranspositionTable(), tree)
+    print("alpha_beta_tt agrees:", value == result.value)
+
+    # The Node view works with code written for alphabetasearch_gemini.py's Node
+    small = ProceduralTree(seed=1, branching=3, depth=2).node()
+    print([(child.name, [leaf.value for leaf in child.children]) for child in small.children])
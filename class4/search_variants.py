@@ -0,0 +1,182 @@
+"""
+Negamax-formulated alpha-beta, Principal Variation Search and MTD(f).
+
+All three share one search core and the transposition table of
+transposition.py (same entries, same probe_cutoff/bound_for rules) and walk
+positions through the game interface of games.py. Negamax values are from
+the point of view of the side to move; the public functions convert them
+back so every variant returns the value from MAX's point of view, like
+alpha_beta_tt().
+
+Table entries use the same key, (game.key(position), maximizing), and the
+same MAX-perspective values and bounds as alpha_beta_tt(): values are
+negated (and LOWER/UPPER swapped) on the way in and out at MIN nodes, so
+one table can be shared between all of these searches.
+"""
+from transposition import (EXACT, LOWER, UPPER, TranspositionTable, bound_for, ordered_children,
+                           probe_cutoff)
+
+# Bound seen from the other side: a lower bound for MAX is an upper bound for MIN
+_FLIPPED = {EXACT: EXACT, LOWER: UPPER, UPPER: LOWER}
+
+
+class SearchCounters:
+    def __init__(self):
+        self.nodes = 0          # positions entered, leaves included
+        self.cutoffs = 0        # beta cutoffs
+        self.researches = 0     # PVS: null-window searches that had to be repeated
+        self.passes = 0         # MTD(f): null-window searches from the root
+
+    def __repr__(self):
+        return (f"SearchCounters(nodes={self.nodes}, cutoffs={self.cutoffs}, "
+                f"researches={self.researches}, passes={self.passes})")
+
+
+class NegamaxSearch:
+    """
+    Fail-soft negamax alpha-beta with optional PVS, over a game interface.
+
+    A node's value is the negation of its best child's value from the
+    child's side, so MAX and MIN nodes share one code path. With pvs=True
+    only the first child (the table's best move, if any) is searched with
+    the full window; the others get a null window (alpha, alpha + 1) that
+    just proves they are no better, and are re-searched only if that proof
+    fails.
+    """
+
+    def __init__(self, game, table=None, pvs=False):
+        """
+        Args:
+            game: Game interface, see games.py.
+            table (TranspositionTable): Table to use, or None for no table.
+            pvs (bool): Principal Variation Search instead of plain alpha-beta.
+        """
+        self.game = game
+        self.table = table
+        self.pvs = pvs
+        self.counters = SearchCounters()
+
+    def search(self, node, depth, alpha, beta, maximizing_player):
+        """Value of node from the side to move's point of view."""
+        game = self.game
+        counters = self.counters
+        counters.nodes += 1
+        if depth == 0 or game.is_terminal(node):
+            value = game.evaluate(node)
+            return value if maximizing_player else -value
+
+        table = self.table
+        key = best_move = None
+        alpha_orig, beta_orig = alpha, beta
+        if table is not None:
+            key = (game.key(node), maximizing_player)
+            entry = table.probe(key)
+            if entry is not None and not maximizing_player:
+                entry = entry[:2] + (-entry[2], _FLIPPED[entry[3]]) + entry[4:]
+            value, alpha, beta = probe_cutoff(entry, depth, alpha, beta)
+            if value is not None:
+                return value
+            if entry is not None:
+                best_move = entry[4]
+
+        best = float('-inf')
+        first = True
+        for move, child in ordered_children(game, node, best_move):
+            if first or not self.pvs:
+                value = -self.search(child, depth - 1, -beta, -alpha, not maximizing_player)
+            else:
+                value = -self.search(child, depth - 1, -alpha - 1, -alpha, not maximizing_player)
+                if alpha < value < beta:
+                    counters.researches += 1
+                    value = -self.search(child, depth - 1, -beta, -value, not maximizing_player)
+            first = False
+            if value > best:
+                best, best_move = value, move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                counters.cutoffs += 1
+                break
+
+        if table is not None:
+            bound = bound_for(best, alpha_orig, beta_orig)
+            if maximizing_player:
+                table.store(key, depth, best, bound, best_move)
+            else:
+                table.store(key, depth, -best, _FLIPPED[bound], best_move)
+        return best
+
+
+def _from_max(value, maximizing_player):
+    return value if maximizing_player else -value
+
+
+def negamax(game, root, depth, maximizing_player=True, table=None, counters=None):
+    """
+    Negamax alpha-beta from root.
+
+    Args:
+        counters (SearchCounters): Filled in with the node and cutoff counts.
+
+    Returns:
+        The minimax value of root from MAX's point of view.
+    """
+    searcher = NegamaxSearch(game, table)
+    if counters is not None:
+        searcher.counters = counters
+    value = searcher.search(root, depth, float('-inf'), float('inf'), maximizing_player)
+    return _from_max(value, maximizing_player)
+
+
+def principal_variation_search(game, root, depth, maximizing_player=True, table=None,
+                               counters=None):
+    """Like negamax() but with Principal Variation Search (null windows after the first move)."""
+    searcher = NegamaxSearch(game, table, pvs=True)
+    if counters is not None:
+        searcher.counters = counters
+    value = searcher.search(root, depth, float('-inf'), float('inf'), maximizing_player)
+    return _from_max(value, maximizing_player)
+
+
+def mtdf(game, root, depth, guess=0, maximizing_player=True, table=None, counters=None):
+    """
+    MTD(f): find the value with a series of null-window searches.
+
+    Each pass asks "is the value at least beta?" and moves an upper or lower
+    bound, starting from guess, until the bounds meet. Passes re-visit the
+    same nodes, so MTD(f) depends on the transposition table (one is created
+    if none is given) and works best when guess is close, e.g. the value
+    from the previous iteration of iterative deepening. Values must be
+    integers.
+
+    Args:
+        guess: First guess of the value, from MAX's point of view.
+
+    Returns:
+        The minimax value of root from MAX's point of view.
+    """
+    searcher = NegamaxSearch(game, table if table is not None else TranspositionTable())
+    if counters is not None:
+        searcher.counters = counters
+    value = _from_max(guess, maximizing_player)
+    lower, upper = float('-inf'), float('inf')
+    while lower < upper:
+        beta = max(value, lower + 1)
+        searcher.counters.passes += 1
+        value = searcher.search(root, depth, beta - 1, beta, maximizing_player)
+        if value < beta:
+            upper = value
+        else:
+            lower = value
+    return _from_max(value, maximizing_player)
+
+
+if __name__ == "__main__":
+    from games import TicTacToe
+
+    game = TicTacToe()
+    root = game.initial()
+    for name, function in (("negamax", negamax), ("PVS", principal_variation_search),
+                           ("MTD(f)", mtdf)):
+        counters = SearchCounters()
+        value = function(game, root, 9, table=TranspositionTable(1 << 14), counters=counters)
+        print(f"{name:8} tic-tac-toe value {value}, {counters}")
@@ -0,0 +1,196 @@
+from games import Node, NodeGame, TicTacToe
+
+# Bound types stored with each value
+EXACT = 0   # value is the true minimax value
+LOWER = 1   # search failed high: true value >= value
+UPPER = 2   # search failed low: true value <= value
+
+
+class TranspositionTable:
+    """
+    Fixed-size transposition table.
+
+    Positions reached through different move orders share one entry, so
+    their subtree is searched once. Each slot holds
+    (key, depth, value, bound, best_move, generation). The table never grows:
+    a key maps to slot hash(key) % size, and a new result replaces the old
+    one if the old one is from a previous search, was searched less deep, or
+    is the same position (depth-preferred replacement with aging).
+    """
+
+    def __init__(self, size=1 << 16):
+        self.size = size
+        self.slots = [None] * size
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def new_search(self):
+        """Age existing entries so a new search can overwrite them freely."""
+        self.generation += 1
+
+    def clear(self):
+        self.slots = [None] * self.size
+
+    def probe(self, key):
+        """Return the entry for key, or None."""
+        self.probes += 1
+        entry = self.slots[hash(key) % self.size]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def store(self, key, depth, value, bound, best_move):
+        index = hash(key) % self.size
+        old = self.slots[index]
+        if (old is None or old[0] == key or old[5] != self.generation
+                or depth >= old[1]):
+            self.slots[index] = (key, depth, value, bound, best_move, self.generation)
+            self.stores += 1
+
+    def __len__(self):
+        return sum(1 for entry in self.slots if entry is not None)
+
+
+def bound_for(value, alpha, beta):
+    """Bound type of a fail-soft result searched with window (alpha, beta)."""
+    if value <= alpha:
+        return UPPER
+    if value >= beta:
+        return LOWER
+    return EXACT
+
+
+def probe_cutoff(entry, depth, alpha, beta):
+    """
+    Use a table entry to narrow (alpha, beta).
+
+    Returns:
+        tuple: (value or None, alpha, beta); value is not None when the entry
+               alone decides this node.
+    """
+    if entry is None or entry[1] < depth:
+        return None, alpha, beta
+    value, bound = entry[2], entry[3]
+    if bound == EXACT:
+        return value, alpha, beta
+    if bound == LOWER:
+        alpha = max(alpha, value)
+    else:
+        beta = min(beta, value)
+    if alpha >= beta:
+        return value, alpha, beta
+    return None, alpha, beta
+
+
+def ordered_children(game, node, best_move):
+    """Children of node with the table's best move (if any) tried first."""
+    children = game.children(node)
+    if best_move is not None:
+        for i, (move, _) in enumerate(children):
+            if move == best_move:
+                children.insert(0, children.pop(i))
+                break
+    return children
+
+
+def alpha_beta_tt(node, depth, alpha, beta, maximizing_player, table, game=NodeGame(),
+                  counters=None):
+    """
+    alpha_beta_pruning() from alphabetasearch_gemini.py with a transposition table.
+
+    Before searching a node the table is probed: an entry searched at least
+    as deep either settles the node (exact value, or a bound outside the
+    window) or narrows the window, and its best move is tried first. After
+    the search the value is stored with its bound type and best move.
+
+    Args:
+        node: Position to search.
+        depth (int): Remaining depth.
+        alpha, beta: Search window.
+        maximizing_player (bool): True if MAX is to move.
+        table (TranspositionTable): Shared table, or None to search without one.
+        game: Game interface, see games.py. Defaults to the Node trees.
+        counters: Optional object whose nodes and cutoffs attributes are
+                  incremented, e.g. search_variants.SearchCounters.
+
+    Returns:
+        The minimax value of node (fail-soft).
+    """
+    if counters is not None:
+        counters.nodes += 1
+    if depth == 0 or game.is_terminal(node):
+        return game.evaluate(node)
+
+    key = best_move = None
+    alpha_orig, beta_orig = alpha, beta
+    if table is not None:
+        key = (game.key(node), maximizing_player)
+        entry = table.probe(key)
+        value, alpha, beta = probe_cutoff(entry, depth, alpha, beta)
+        if value is not None:
+            return value
+        if entry is not None:
+            best_move = entry[4]
+
+    if maximizing_player:
+        best = float('-inf')
+        for move, child in ordered_children(game, node, best_move):
+            value = alpha_beta_tt(child, depth - 1, alpha, beta, False, table, game, counters)
+            if value > best:
+                best, best_move = value, move
+            alpha = max(alpha, value)
+            if beta <= alpha:
+                if counters is not None:
+                    counters.cutoffs += 1
+                break  # Beta cut-off
+    else:
+        best = float('inf')
+        for move, child in ordered_children(game, node, best_move):
+            value = alpha_beta_tt(child, depth - 1, alpha, beta, True, table, game, counters)
+            if value < best:
+                best, best_move = value, move
+            beta = min(beta, value)
+            if beta <= alpha:
+                if counters is not None:
+                    counters.cutoffs += 1
+                break  # Alpha cut-off
+
+    if table is not None:
+        table.store(key, depth, best, bound_for(best, alpha_orig, beta_orig), best_move)
+    return best
+
+
+class CountingGame:
+    """Wraps a game and counts how many times children are generated."""
+
+    def __init__(self, game):
+        self.game = game
+        self.expanded = 0
+
+    def children(self, position):
+        self.expanded += 1
+        return self.game.children(position)
+
+    def __getattr__(self, name):
+        return getattr(self.game, name)
+
+
+if __name__ == "__main__":
+    # The tree from alphabetasearch_gemini.py
+    D, E, F = Node('D', value=3), Node('E', value=5), Node('F', value=6)
+    G, H, I = Node('G', value=9), Node('H', value=1), Node('I', value=2)
+    A = Node('A', children=[Node('B', children=[D, E, F]), Node('C', children=[G, H, I])])
+    table = TranspositionTable()
+    print("Optimal value:", alpha_beta_tt(A, 3, float('-inf'), float('inf'), True, table))
+
+    # Tic-tac-toe from the empty board: many move orders reach the same position
+    game = TicTacToe()
+    root = game.initial()
+    for table in (None, TranspositionTable(1 << 14)):
+        counting = CountingGame(game)
+        value = alpha_beta_tt(root, 9, float('-inf'), float('inf'), True, table, counting)
+        label = "without table" if table is None else f"with table ({table.hits} hits)"
+        print(f"Tic-tac-toe value {value}, {counting.expanded} nodes expanded {label}")